@@ -0,0 +1,159 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Micro-benchmark of the output path of a Python worker: how many rows per second
+the OutputManager can batch with each partitioner and convert into Arrow frames,
+from Tuples and from the whole Arrow batches of an ArrowBatchOperator.
+
+Usage:
+    python -m benchmarks.partitioner_benchmark [--rows N] [--receivers N]
+"""
+
+import argparse
+import time
+
+import pyarrow
+
+from core.architecture.packaging.output_manager import OutputManager
+from core.models import Schema, Tuple
+from core.models.marker import EndOfInputChannel
+from core.util import set_one_of
+from proto.edu.uci.ics.amber.core import (
+    ActorVirtualIdentity,
+    ChannelIdentity,
+    PhysicalLink,
+    PortIdentity,
+)
+from proto.edu.uci.ics.amber.engine.architecture.sendsemantics import (
+    BroadcastPartitioning,
+    HashBasedShufflePartitioning,
+    OneToOnePartitioning,
+    Partitioning,
+    RangeBasedShufflePartitioning,
+    RoundRobinPartitioning,
+)
+
+WORKER_ID = "benchmark_worker"
+BATCH_SIZE = 400
+SCHEMA = Schema(
+    raw_schema={
+        "id": "INTEGER",
+        "key": "LONG",
+        "score": "DOUBLE",
+        "name": "STRING",
+        "flag": "BOOLEAN",
+    }
+)
+
+
+def make_tuples(num_rows: int):
+    tuples = []
+    for i in range(num_rows):
+        tuple_ = Tuple(
+            {
+                "id": i,
+                "key": i % 1000,
+                "score": i * 0.5,
+                "name": f"name-{i % 100}",
+                "flag": i % 2 == 0,
+            }
+        )
+        tuple_.finalize(SCHEMA)
+        tuples.append(tuple_)
+    return tuples
+
+
+def make_partitionings(num_rows: int, num_receivers: int):
+    channels = [
+        ChannelIdentity(
+            ActorVirtualIdentity(WORKER_ID),
+            ActorVirtualIdentity(f"receiver-{i}"),
+            False,
+        )
+        for i in range(num_receivers)
+    ]
+    return {
+        "one-to-one": OneToOnePartitioning(
+            batch_size=BATCH_SIZE, channels=channels[:1]
+        ),
+        "round-robin": RoundRobinPartitioning(batch_size=BATCH_SIZE, channels=channels),
+        "hash": HashBasedShufflePartitioning(
+            batch_size=BATCH_SIZE, channels=channels, hash_attribute_names=["key"]
+        ),
+        "range": RangeBasedShufflePartitioning(
+            batch_size=BATCH_SIZE,
+            channels=channels,
+            range_attribute_names=["id"],
+            range_min=0,
+            range_max=num_rows,
+        ),
+        "broadcast": BroadcastPartitioning(batch_size=BATCH_SIZE, channels=channels),
+    }
+
+
+def run(partitioning, tuples) -> float:
+    output_manager = OutputManager(WORKER_ID)
+    output_manager.add_output_port(PortIdentity(0), SCHEMA)
+    output_manager.add_partitioning(
+        PhysicalLink(), set_one_of(Partitioning, partitioning)
+    )
+    start = time.perf_counter()
+    for tuple_ in tuples:
+        for _ in output_manager.tuple_to_batch(tuple_):
+            pass
+    for _ in output_manager.emit_marker(EndOfInputChannel()):
+        pass
+    return len(tuples) / (time.perf_counter() - start)
+
+
+def run_arrow_batches(partitioning, tuples, batch_rows: int = 4096) -> float:
+    output_manager = OutputManager(WORKER_ID)
+    output_manager.add_output_port(PortIdentity(0), SCHEMA)
+    output_manager.add_partitioning(
+        PhysicalLink(), set_one_of(Partitioning, partitioning)
+    )
+    table = pyarrow.Table.from_pylist(
+        [tuple_.as_dict() for tuple_ in tuples], schema=SCHEMA.as_arrow_schema()
+    )
+    start = time.perf_counter()
+    for offset in range(0, table.num_rows, batch_rows):
+        for _ in output_manager.arrow_table_to_batch(table.slice(offset, batch_rows)):
+            pass
+    for _ in output_manager.emit_marker(EndOfInputChannel()):
+        pass
+    return table.num_rows / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--receivers", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    tuples = make_tuples(args.rows)
+    print(f"{'partitioner':<12} {'tuples/s':>12} {'arrow rows/s':>14}")
+    for name, partitioning in make_partitionings(args.rows, args.receivers).items():
+        rows_per_second = max(run(partitioning, tuples) for _ in range(args.repeat))
+        arrow_rows_per_second = max(
+            run_arrow_batches(partitioning, tuples) for _ in range(args.repeat)
+        )
+        print(f"{name:<12} {rows_per_second:>12,.0f} {arrow_rows_per_second:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,7 @@
 
 from core.architecture.handlers.control.control_handler_base import ControlHandler
 from core.architecture.managers.context import Context
+from core.architecture.managers.executor_manager import ExecutionMode
 from core.architecture.managers.pause_manager import PauseType
 from proto.edu.uci.ics.amber.engine.architecture.rpc import (
     EmptyReturn,
@@ -29,6 +30,9 @@ class WorkerDebugCommandHandler(ControlHandler):
         # translate the command with the context.
         translated_command = self.translate_debug_command(req.cmd, self.context)
 
+        # the debugger can only suspend the executor on its own thread.
+        self.context.executor_manager.execution_mode = ExecutionMode.THREADED
+
         # send the translated command to debugger to consume later.
         self.context.debug_manager.put_debug_command(translated_command)
 
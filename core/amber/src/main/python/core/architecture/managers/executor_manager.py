@@ -18,6 +18,7 @@
 import importlib
 import inspect
 import sys
+from enum import Enum
 from cached_property import cached_property
 
 import fs
@@ -26,14 +27,25 @@ from typing import Tuple, Optional
 
 from fs.base import FS
 from loguru import logger
+from core.architecture.worker_config import WorkerConfig
 from core.models import Operator, SourceOperator
 
 
+class ExecutionMode(Enum):
+    # the executor runs on a dedicated DataProcessor thread, which can be
+    # suspended by the debugger.
+    THREADED = 0
+    # the executor runs inline on the MainLoop thread, without any context switch
+    # between threads.
+    COOPERATIVE = 1
+
+
 class ExecutorManager:
     def __init__(self):
         self.executor: Optional[Operator] = None
         self.operator_module_name: Optional[str] = None
         self.executor_version: int = 0  # incremental only
+        self.execution_mode: ExecutionMode = ExecutionMode.THREADED
 
     @cached_property
     def fs(self) -> FS:
@@ -160,6 +172,11 @@ class ExecutorManager:
         assert (
             isinstance(self.executor, SourceOperator) == self.executor.is_source
         ), "Please use SourceOperator API for source operators."
+        self.execution_mode = (
+            ExecutionMode.COOPERATIVE
+            if WorkerConfig.COOPERATIVE_EXECUTION
+            else ExecutionMode.THREADED
+        )
 
     def update_executor(self, code: str, is_source: bool) -> None:
         """
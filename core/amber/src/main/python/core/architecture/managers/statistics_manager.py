@@ -15,9 +15,11 @@
 # specific language governing permissions and limitations
 # under the License.
 
-from typing import DefaultDict
+from typing import DefaultDict, Sequence
 from collections import defaultdict
 
+from core.architecture.managers.tuple_size_estimator import TupleSizeEstimator
+from core.models import Tuple
 from proto.edu.uci.ics.amber.core import PortIdentity
 from proto.edu.uci.ics.amber.engine.architecture.worker import (
     WorkerStatistics,
@@ -35,6 +37,12 @@ class StatisticsManager:
         self._output_tuple_metrics: DefaultDict[PortIdentity, TupleMetrics] = (
             defaultdict(lambda: (0, 0))
         )
+        self._input_size_estimators: DefaultDict[PortIdentity, TupleSizeEstimator] = (
+            defaultdict(TupleSizeEstimator)
+        )
+        self._output_size_estimators: DefaultDict[PortIdentity, TupleSizeEstimator] = (
+            defaultdict(TupleSizeEstimator)
+        )
         self._data_processing_time: int = 0
         self._control_processing_time: int = 0
         self._total_execution_time: int = 0
@@ -58,17 +66,43 @@ class StatisticsManager:
             - self._control_processing_time,
         )
 
-    def increase_input_statistics(self, port_id: PortIdentity, size: int) -> None:
+    def increase_input_statistics(
+        self, port_id: PortIdentity, size: int, count: int = 1
+    ) -> None:
         if size < 0:
             raise ValueError("Tuple size must be non-negative")
-        count, total_size = self._input_tuple_metrics[port_id]
-        self._input_tuple_metrics[port_id] = (count + 1, total_size + size)
+        if count < 0:
+            raise ValueError("Tuple count must be non-negative")
+        total_count, total_size = self._input_tuple_metrics[port_id]
+        self._input_tuple_metrics[port_id] = (total_count + count, total_size + size)
 
-    def increase_output_statistics(self, port_id: PortIdentity, size: int) -> None:
+    def increase_output_statistics(
+        self, port_id: PortIdentity, size: int, count: int = 1
+    ) -> None:
         if size < 0:
             raise ValueError("Tuple size must be non-negative")
-        count, total_size = self._output_tuple_metrics[port_id]
-        self._output_tuple_metrics[port_id] = (count + 1, total_size + size)
+        if count < 0:
+            raise ValueError("Tuple count must be non-negative")
+        total_count, total_size = self._output_tuple_metrics[port_id]
+        self._output_tuple_metrics[port_id] = (total_count + count, total_size + size)
+
+    def increase_input_tuple_statistics(
+        self, port_id: PortIdentity, tuples: Sequence[Tuple]
+    ) -> None:
+        self.increase_input_statistics(
+            port_id,
+            self._input_size_estimators[port_id].estimate(tuples),
+            count=len(tuples),
+        )
+
+    def increase_output_tuple_statistics(
+        self, port_id: PortIdentity, tuples: Sequence[Tuple]
+    ) -> None:
+        self.increase_output_statistics(
+            port_id,
+            self._output_size_estimators[port_id].estimate(tuples),
+            count=len(tuples),
+        )
 
     def increase_data_processing_time(self, time: int) -> None:
         if time < 0:
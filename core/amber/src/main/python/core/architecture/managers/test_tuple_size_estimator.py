@@ -0,0 +1,66 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import random
+
+import pyarrow
+import pytest
+
+from core.architecture.managers.tuple_size_estimator import TupleSizeEstimator
+from core.models import ArrowRowView, Schema, Tuple
+
+
+class TestTupleSizeEstimator:
+    @pytest.fixture
+    def schema(self):
+        return Schema(raw_schema={"id": "INTEGER", "text": "STRING"})
+
+    @pytest.fixture
+    def tuples(self, schema):
+        random.seed(42)
+        tuples = []
+        for i in range(3000):
+            tuple_ = Tuple({"id": i, "text": "x" * random.randint(0, 200)})
+            tuple_.finalize(schema)
+            tuples.append(tuple_)
+        return tuples
+
+    def test_estimates_arrow_size_of_tuples(self, schema, tuples):
+        table = pyarrow.Table.from_pylist(
+            [tuple_.as_dict() for tuple_ in tuples], schema=schema.as_arrow_schema()
+        )
+        estimated = TupleSizeEstimator(sampling=False).estimate(tuples)
+        # the validity and offset buffers are only approximated.
+        assert abs(estimated - table.nbytes) / table.nbytes < 0.01
+
+    def test_estimates_row_views_by_share_of_batch(self, schema, tuples):
+        table = pyarrow.Table.from_pylist(
+            [tuple_.as_dict() for tuple_ in tuples], schema=schema.as_arrow_schema()
+        )
+        views = [
+            Tuple(row_view, schema=schema) for row_view in ArrowRowView.iter_rows(table)
+        ]
+        estimated = TupleSizeEstimator(sampling=False).estimate(views)
+        assert estimated == (table.nbytes // table.num_rows) * table.num_rows
+
+    def test_sampled_estimate_is_within_error(self, tuples):
+        estimator = TupleSizeEstimator(sampling=True, max_error=0.02, interval=100)
+        estimated = sum(estimator.estimate((tuple_,)) for tuple_ in tuples)
+        exact = sum(tuple_.in_mem_size() for tuple_ in tuples)
+        assert estimator.relative_error() <= 0.02
+        assert estimator._num_samples < len(tuples)
+        # a generous bound, of three standard errors.
+        assert abs(estimated - exact) / exact < 0.06
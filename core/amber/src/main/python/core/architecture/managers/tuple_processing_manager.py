@@ -16,8 +16,11 @@
 # under the License.
 
 from threading import Event, Condition
-from typing import Optional, Tuple, Iterator
+from typing import Optional, Tuple, Iterator, List
 
+import pyarrow
+
+from core.architecture.worker_config import WorkerConfig
 from proto.edu.uci.ics.amber.core import PortIdentity
 
 
@@ -30,14 +33,54 @@ class TupleProcessingManager:
         self.context_switch_condition: Condition = Condition()
         self.finished_current: Event = Event()
 
+        # batch-at-a-time hand-off, see WorkerConfig.DATA_PROCESSOR_SLICE_SIZE.
+        self.input_slice_size: int = WorkerConfig.DATA_PROCESSOR_SLICE_SIZE
+        self.max_buffered_outputs: int = (
+            WorkerConfig.DATA_PROCESSOR_MAX_BUFFERED_OUTPUTS
+        )
+        self.current_input_tuple_slice: Optional[List[Tuple]] = None
+        self.unprocessed_input_tuples: List[Tuple] = list()
+        self.current_output_tuples: List[Tuple] = list()
+
+        # batch hand-off of an ArrowBatchOperator, without per-row conversion.
+        self.current_input_batch: Optional[pyarrow.Table] = None
+        self.current_output_batch: Optional[pyarrow.Table] = None
+
+    def is_slicing_enabled(self) -> bool:
+        """
+        Whether input tuples are handed to the DataProcessor in slices, with
+        the produced output tuples buffered and handed back together.
+        """
+        return self.input_slice_size != 1
+
     def get_input_tuple(self) -> Optional[Tuple]:
         ret, self.current_input_tuple = self.current_input_tuple, None
         return ret
 
+    def get_input_tuple_slice(self) -> Optional[List[Tuple]]:
+        ret, self.current_input_tuple_slice = self.current_input_tuple_slice, None
+        return ret
+
+    def get_input_batch(self) -> Optional[pyarrow.Table]:
+        ret, self.current_input_batch = self.current_input_batch, None
+        return ret
+
+    def get_unprocessed_input_tuples(self) -> List[Tuple]:
+        ret, self.unprocessed_input_tuples = self.unprocessed_input_tuples, list()
+        return ret
+
     def get_output_tuple(self) -> Optional[Tuple]:
         ret, self.current_output_tuple = self.current_output_tuple, None
         return ret
 
+    def get_output_tuples(self) -> List[Tuple]:
+        ret, self.current_output_tuples = self.current_output_tuples, list()
+        return ret
+
+    def get_output_batch(self) -> Optional[pyarrow.Table]:
+        ret, self.current_output_batch = self.current_output_batch, None
+        return ret
+
     def get_input_port_id(self) -> int:
         port_id = self.current_input_port_id
         # no upstream, special case for source executor.
@@ -0,0 +1,105 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import math
+from typing import Iterable, Optional
+
+from core.architecture.worker_config import WorkerConfig
+from core.models import Tuple
+
+
+class TupleSizeEstimator:
+    """
+    Estimates the size of the Tuples going through a port, for its byte
+    statistics.
+
+    By default, a Tuple is sized as a row in Arrow buffers: a Tuple viewing a row
+    of an input batch takes its share of the batch's nbytes, and other Tuples are
+    sized by the Arrow widths of their fields.
+
+    In the sampled mode, the deep in-memory size of a Tuple is measured on a
+    sample, and the other Tuples are sized by the mean of the sample. Tuples are
+    measured one after another until the relative standard error of the mean is
+    within the configured bound, then once in every interval.
+    """
+
+    MIN_SAMPLES = 30
+
+    def __init__(
+        self,
+        sampling: Optional[bool] = None,
+        max_error: Optional[float] = None,
+        interval: Optional[int] = None,
+    ):
+        self.sampling = (
+            WorkerConfig.TUPLE_SIZE_SAMPLING if sampling is None else sampling
+        )
+        self.max_error = (
+            WorkerConfig.TUPLE_SIZE_SAMPLING_MAX_ERROR
+            if max_error is None
+            else max_error
+        )
+        self.interval = (
+            WorkerConfig.TUPLE_SIZE_SAMPLING_INTERVAL if interval is None else interval
+        )
+        self._num_seen = 0
+        self._num_samples = 0
+        # running mean and sum of squared deviations of the sampled sizes.
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def estimate(self, tuples: Iterable[Tuple]) -> int:
+        """
+        Estimate the total size of the given Tuples.
+        :param tuples: the Tuples going through the port.
+        :return: The size in bytes.
+        """
+        if not self.sampling:
+            return sum(tuple_.arrow_size() for tuple_ in tuples)
+        size = 0
+        for tuple_ in tuples:
+            self._num_seen += 1
+            if self._should_sample():
+                sampled_size = tuple_.in_mem_size()
+                self._add_sample(sampled_size)
+                size += sampled_size
+            else:
+                size += round(self._mean)
+        return size
+
+    def relative_error(self) -> float:
+        """
+        The relative standard error of the mean sampled size.
+        :return: The error as a fraction of the mean, inf if not yet known.
+        """
+        if self._num_samples < 2 or self._mean == 0:
+            return math.inf
+        variance = self._m2 / (self._num_samples - 1)
+        return math.sqrt(variance / self._num_samples) / self._mean
+
+    def _should_sample(self) -> bool:
+        return (
+            self._num_samples < self.MIN_SAMPLES
+            or self.relative_error() > self.max_error
+            or self._num_seen % self.interval == 0
+        )
+
+    def _add_sample(self, size: int) -> None:
+        # Welford's online algorithm.
+        self._num_samples += 1
+        delta = size - self._mean
+        self._mean += delta / self._num_samples
+        self._m2 += delta * (size - self._mean)
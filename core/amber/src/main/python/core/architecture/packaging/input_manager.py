@@ -17,8 +17,9 @@
 
 import threading
 from typing import Iterator, Optional, Union, Dict, List
+import pyarrow
 from pyarrow.lib import Table
-from core.models import Tuple, ArrowTableTupleProvider, Schema, InternalQueue
+from core.models import Tuple, ArrowRowView, Schema, InternalQueue
 from core.models.internal_marker import (
     InternalMarker,
     StartOfOutputPorts,
@@ -58,6 +59,7 @@ class WorkerPort:
     def __init__(self, schema: Schema):
         self.channels: List[Channel] = list()
         self._schema = schema
+        self._arrow_schema: Optional[pyarrow.Schema] = None
 
     def add_channel(self, channel: Channel) -> None:
         self.channels.append(channel)
@@ -70,6 +72,11 @@ class WorkerPort:
     def get_schema(self) -> Schema:
         return self._schema
 
+    def get_arrow_schema(self) -> pyarrow.Schema:
+        if self._arrow_schema is None:
+            self._arrow_schema = self._schema.as_arrow_schema()
+        return self._arrow_schema
+
 
 class InputManager:
     SOURCE_STARTER = ActorVirtualIdentity("SOURCE_STARTER")
@@ -154,8 +161,11 @@ class InputManager:
         self._ports[port_id].add_channel(channel)
 
     def process_data_payload(
-        self, from_: ChannelIdentity, payload: DataPayload
-    ) -> Iterator[Union[Tuple, InternalMarker]]:
+        self,
+        from_: ChannelIdentity,
+        payload: DataPayload,
+        as_arrow_table: bool = False,
+    ) -> Iterator[Union[Tuple, Table, InternalMarker]]:
 
         self._current_channel_id = from_
 
@@ -166,7 +176,11 @@ class InputManager:
             return
 
         if isinstance(payload, DataFrame):
-            yield from self._process_data(payload.frame)
+            if as_arrow_table:
+                # hand over the whole frame, without converting it into Tuples.
+                yield payload.frame
+            else:
+                yield from self._process_data(payload.frame)
         elif isinstance(payload, MarkerFrame):
             yield from self._process_marker(payload.frame)
         else:
@@ -176,10 +190,8 @@ class InputManager:
         schema = self._ports[
             self._channels[self._current_channel_id].port_id
         ].get_schema()
-        for field_accessor in ArrowTableTupleProvider(table):
-            yield Tuple(
-                {name: field_accessor for name in table.column_names}, schema=schema
-            )
+        for row_view in ArrowRowView.iter_rows(table):
+            yield Tuple(row_view, schema=schema)
 
     def _process_marker(self, marker: Marker) -> Iterator[InternalMarker]:
         if isinstance(marker, State):
@@ -17,7 +17,6 @@
 
 import threading
 import typing
-from collections import OrderedDict
 from itertools import chain
 from queue import Queue
 from threading import Thread
@@ -30,6 +29,7 @@ from core.architecture.packaging.input_manager import WorkerPort, Channel
 from core.architecture.sendsemantics.broad_cast_partitioner import (
     BroadcastPartitioner,
 )
+from core.architecture.sendsemantics.columnar_batch import ColumnarBatch
 from core.architecture.sendsemantics.hash_based_shuffle_partitioner import (
     HashBasedShufflePartitioner,
 )
@@ -71,7 +71,9 @@ from proto.edu.uci.ics.amber.engine.architecture.sendsemantics import (
 class OutputManager:
     def __init__(self, worker_id: str):
         self.worker_id = worker_id
-        self._partitioners: OrderedDict[PhysicalLink, Partitioning] = OrderedDict()
+        # a plain dict keeps the insertion order as well, but unlike OrderedDict,
+        # iterating through it does not hash the (costly to hash) proto keys.
+        self._partitioners: typing.Dict[PhysicalLink, Partitioner] = dict()
         self._partitioning_to_partitioner: dict[
             type(Partitioning), type(Partitioner)
         ] = {
@@ -183,6 +185,21 @@ class OutputManager:
                 PortStorageWriterElement(data_tuple=tuple_)
             )
 
+    def save_arrow_table_to_storage_if_needed(self, table: Table, port_id=None) -> None:
+        """
+        Optionally write the rows of an Arrow table to storage, as Tuples, if the
+        specified output port is determined by the scheduler to need storage.
+        :param table: A pyarrow.Table produced by the data processor.
+        :param port_id: If not specified, the rows will be written to all
+        output ports that need storage.
+        :return:
+        """
+        if not self._port_storage_writers:
+            return
+        schema = self.get_port().get_schema()
+        for row in table.to_pylist():
+            self.save_tuple_to_storage_if_needed(Tuple(row, schema=schema), port_id)
+
     def close_port_storage_writers(self) -> None:
         """
         Flush the buffers of port storage writers and wait for all the
@@ -223,11 +240,26 @@ class OutputManager:
     def tuple_to_batch(
         self, tuple_: Tuple
     ) -> Iterator[typing.Tuple[ActorVirtualIdentity, DataFrame]]:
+        for partitioner in self._partitioners.values():
+            for receiver, batch in partitioner.add_tuple_to_batch(tuple_):
+                yield receiver, self.tuple_to_frame(batch)
+
+    def arrow_table_to_batch(
+        self, table: Table
+    ) -> Iterator[typing.Tuple[ActorVirtualIdentity, DataFrame]]:
+        schema = self.get_port().get_schema()
         return chain(
             *(
                 (
-                    (receiver, self.tuple_to_frame(tuples))
-                    for receiver, tuples in partitioner.add_tuple_to_batch(tuple_)
+                    (
+                        receiver,
+                        (
+                            DataFrame(frame=payload)
+                            if isinstance(payload, Table)
+                            else self.tuple_to_frame(payload)
+                        ),
+                    )
+                    for receiver, payload in partitioner.add_arrow_batch(table, schema)
                 )
                 for partitioner in self._partitioners.values()
             )
@@ -270,13 +302,5 @@ class OutputManager:
             )
         )
 
-    def tuple_to_frame(self, tuples: typing.List[Tuple]) -> DataFrame:
-        return DataFrame(
-            frame=Table.from_pydict(
-                {
-                    name: [t[name] for t in tuples]
-                    for name in self.get_port().get_schema().get_attr_names()
-                },
-                schema=self.get_port().get_schema().as_arrow_schema(),
-            )
-        )
+    def tuple_to_frame(self, batch: ColumnarBatch) -> DataFrame:
+        return DataFrame(frame=batch.to_arrow_table(self.get_port().get_arrow_schema()))
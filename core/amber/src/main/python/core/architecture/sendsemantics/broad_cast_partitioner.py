@@ -18,10 +18,12 @@
 import typing
 from typing import Iterator
 
+import pyarrow
 from overrides import overrides
 
+from core.architecture.sendsemantics.columnar_batch import ColumnarBatch
 from core.architecture.sendsemantics.partitioner import Partitioner
-from core.models import Tuple
+from core.models import Tuple, Schema
 from core.models.marker import Marker
 from core.util import set_one_of
 from proto.edu.uci.ics.amber.engine.architecture.sendsemantics import (
@@ -35,7 +37,7 @@ class BroadcastPartitioner(Partitioner):
     def __init__(self, partitioning: BroadcastPartitioning):
         super().__init__(set_one_of(Partitioning, partitioning))
         self.batch_size = partitioning.batch_size
-        self.batch: list[Tuple] = list()
+        self.batch: ColumnarBatch = ColumnarBatch()
         self.receivers = list(
             {channel.to_worker_id for channel in partitioning.channels}
         )
@@ -43,17 +45,32 @@ class BroadcastPartitioner(Partitioner):
     @overrides
     def add_tuple_to_batch(
         self, tuple_: Tuple
-    ) -> Iterator[typing.Tuple[ActorVirtualIdentity, typing.List[Tuple]]]:
+    ) -> Iterator[typing.Tuple[ActorVirtualIdentity, ColumnarBatch]]:
         self.batch.append(tuple_)
         if len(self.batch) == self.batch_size:
             for receiver in self.receivers:
                 yield receiver, self.batch
             self.reset()
 
+    @overrides
+    def add_arrow_batch(
+        self, batch: pyarrow.Table, schema: Schema
+    ) -> Iterator[
+        typing.Tuple[ActorVirtualIdentity, typing.Union[pyarrow.Table, ColumnarBatch]]
+    ]:
+        if len(self.batch) > 0:
+            for receiver in self.receivers:
+                yield receiver, self.batch
+            self.reset()
+        for offset in range(0, batch.num_rows, self.batch_size):
+            batch_slice = batch.slice(offset, self.batch_size)
+            for receiver in self.receivers:
+                yield receiver, batch_slice
+
     @overrides
     def flush(
         self, to: ActorVirtualIdentity, marker: Marker
-    ) -> Iterator[typing.Union[Marker, typing.List[Tuple]]]:
+    ) -> Iterator[typing.Union[Marker, ColumnarBatch]]:
         if len(self.batch) > 0:
             for receiver in self.receivers:
                 if receiver == to:
@@ -68,7 +85,7 @@ class BroadcastPartitioner(Partitioner):
     def flush_marker(
         self, marker: Marker
     ) -> Iterator[
-        typing.Tuple[ActorVirtualIdentity, typing.Union[Marker, typing.List[Tuple]]]
+        typing.Tuple[ActorVirtualIdentity, typing.Union[Marker, ColumnarBatch]]
     ]:
         if len(self.batch) > 0:
             for receiver in self.receivers:
@@ -80,4 +97,4 @@ class BroadcastPartitioner(Partitioner):
 
     @overrides
     def reset(self) -> None:
-        self.batch = list()
+        self.batch = ColumnarBatch()
@@ -0,0 +1,72 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import typing
+from typing import List, Optional
+
+import pyarrow
+
+from core.models import Tuple
+from core.models.schema.field import Field
+
+
+class ColumnarBatch:
+    """
+    A batch of output Tuples to a receiver, buffered column by column so that the
+    batch can be converted into a pyarrow.Table with a single Arrow call.
+    """
+
+    __slots__ = ("_field_names", "_columns", "_num_rows")
+
+    def __init__(self):
+        self._field_names: Optional[typing.Tuple[str, ...]] = None
+        self._columns: Optional[List[List[Field]]] = None
+        self._num_rows: int = 0
+
+    def append(self, tuple_: Tuple) -> None:
+        """
+        Append the field values of a Tuple to the columns. All the Tuples of a
+        batch are expected to have the same fields, as finalized by the same Schema.
+
+        :param tuple_: the Tuple to be appended.
+        """
+        if self._columns is None:
+            self._field_names = tuple_.get_field_names()
+            self._columns = [[] for _ in self._field_names]
+        for column, field_name in zip(self._columns, self._field_names):
+            column.append(tuple_[field_name])
+        self._num_rows += 1
+
+    def to_arrow_table(self, arrow_schema: pyarrow.Schema) -> pyarrow.Table:
+        """
+        Convert the buffered columns into a pyarrow.Table.
+
+        :param arrow_schema: the pyarrow.Schema of the output port.
+        :return: a pyarrow.Table in the given schema.
+        """
+        if self._columns is None:
+            return arrow_schema.empty_table()
+        return pyarrow.Table.from_pydict(
+            dict(zip(self._field_names, self._columns)), schema=arrow_schema
+        )
+
+    def clear(self) -> None:
+        self._field_names = None
+        self._columns = None
+        self._num_rows = 0
+
+    def __len__(self) -> int:
+        return self._num_rows
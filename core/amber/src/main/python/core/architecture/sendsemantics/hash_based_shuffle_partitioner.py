@@ -18,10 +18,17 @@
 import typing
 from typing import Iterator
 
+import numpy
+import pyarrow
 from loguru import logger
 from overrides import overrides
-from core.architecture.sendsemantics.partitioner import Partitioner
-from core.models import Tuple
+from core.architecture.sendsemantics.columnar_batch import ColumnarBatch
+from core.architecture.sendsemantics.partitioner import (
+    Partitioner,
+    partition_arrow_batch,
+)
+from core.models import Tuple, Schema
+from core.models.tuple import java_hash_columns
 from core.models.marker import Marker
 from core.util import set_one_of
 from proto.edu.uci.ics.amber.engine.architecture.sendsemantics import (
@@ -37,7 +44,7 @@ class HashBasedShufflePartitioner(Partitioner):
         logger.debug(f"got {partitioning}")
         self.batch_size = partitioning.batch_size
         self.receivers = [
-            (receiver, [])
+            (receiver, ColumnarBatch())
             for receiver in {channel.to_worker_id for channel in partitioning.channels}
         ]
         self.hash_attribute_names = partitioning.hash_attribute_names
@@ -45,7 +52,7 @@ class HashBasedShufflePartitioner(Partitioner):
     @overrides
     def add_tuple_to_batch(
         self, tuple_: Tuple
-    ) -> Iterator[typing.Tuple[ActorVirtualIdentity, typing.List[Tuple]]]:
+    ) -> Iterator[typing.Tuple[ActorVirtualIdentity, ColumnarBatch]]:
         partial_tuple = (
             tuple_
             if not self.hash_attribute_names
@@ -56,25 +63,50 @@ class HashBasedShufflePartitioner(Partitioner):
         batch.append(tuple_)
         if len(batch) == self.batch_size:
             yield receiver, batch
-            self.receivers[hash_code] = (receiver, list())
+            self.receivers[hash_code] = (receiver, ColumnarBatch())
+
+    @overrides
+    def add_arrow_batch(
+        self, batch: pyarrow.Table, schema: Schema
+    ) -> Iterator[
+        typing.Tuple[ActorVirtualIdentity, typing.Union[pyarrow.Table, ColumnarBatch]]
+    ]:
+        if batch.num_rows == 0:
+            return
+        attribute_names = self.hash_attribute_names or batch.column_names
+        hash_codes = java_hash_columns(
+            [batch.column(name) for name in attribute_names],
+            [schema.get_attr_type(name) for name in attribute_names],
+            batch.num_rows,
+        ).astype(numpy.int64)
+        # hash() maps a __hash__ of -1 to -2, which add_tuple_to_batch relies on.
+        hash_codes[hash_codes == -1] = -2
+        yield from partition_arrow_batch(
+            batch,
+            numpy.mod(hash_codes, len(self.receivers)),
+            self.receivers,
+            self.batch_size,
+        )
 
     @overrides
     def flush(
         self, to: ActorVirtualIdentity, marker: Marker
-    ) -> Iterator[typing.Union[Marker, typing.List[Tuple]]]:
+    ) -> Iterator[typing.Union[Marker, ColumnarBatch]]:
         for receiver, batch in self.receivers:
             if receiver == to:
                 if len(batch) > 0:
                     yield batch
+                    batch.clear()
                 yield marker
 
     @overrides
     def flush_marker(
         self, marker: Marker
     ) -> Iterator[
-        typing.Tuple[ActorVirtualIdentity, typing.Union[Marker, typing.List[Tuple]]]
+        typing.Tuple[ActorVirtualIdentity, typing.Union[Marker, ColumnarBatch]]
     ]:
         for receiver, batch in self.receivers:
             if len(batch) > 0:
                 yield receiver, batch
+                batch.clear()
             yield receiver, marker
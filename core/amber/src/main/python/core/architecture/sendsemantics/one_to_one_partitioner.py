@@ -18,9 +18,11 @@
 import typing
 from typing import Iterator
 
+import pyarrow
 from overrides import overrides
+from core.architecture.sendsemantics.columnar_batch import ColumnarBatch
 from core.architecture.sendsemantics.partitioner import Partitioner
-from core.models import Tuple
+from core.models import Tuple, Schema
 from core.models.marker import Marker
 from core.util import set_one_of
 from proto.edu.uci.ics.amber.engine.architecture.sendsemantics import (
@@ -34,7 +36,7 @@ class OneToOnePartitioner(Partitioner):
     def __init__(self, partitioning: OneToOnePartitioning, worker_id: str):
         super().__init__(set_one_of(Partitioning, partitioning))
         self.batch_size = partitioning.batch_size
-        self.batch: list[Tuple] = list()
+        self.batch: ColumnarBatch = ColumnarBatch()
         for channel in partitioning.channels:
             if channel.from_worker_id.name == worker_id:
                 self.receiver = channel.to_worker_id
@@ -43,16 +45,28 @@ class OneToOnePartitioner(Partitioner):
     @overrides
     def add_tuple_to_batch(
         self, tuple_: Tuple
-    ) -> Iterator[typing.Tuple[ActorVirtualIdentity, typing.List[Tuple]]]:
+    ) -> Iterator[typing.Tuple[ActorVirtualIdentity, ColumnarBatch]]:
         self.batch.append(tuple_)
         if len(self.batch) == self.batch_size:
             yield self.receiver, self.batch
             self.reset()
 
+    @overrides
+    def add_arrow_batch(
+        self, batch: pyarrow.Table, schema: Schema
+    ) -> Iterator[
+        typing.Tuple[ActorVirtualIdentity, typing.Union[pyarrow.Table, ColumnarBatch]]
+    ]:
+        if len(self.batch) > 0:
+            yield self.receiver, self.batch
+            self.reset()
+        for offset in range(0, batch.num_rows, self.batch_size):
+            yield self.receiver, batch.slice(offset, self.batch_size)
+
     @overrides
     def flush(
         self, to: ActorVirtualIdentity, marker: Marker
-    ) -> Iterator[typing.Union[Marker, typing.List[Tuple]]]:
+    ) -> Iterator[typing.Union[Marker, ColumnarBatch]]:
         if len(self.batch) > 0:
             yield self.batch
         self.reset()
@@ -62,7 +76,7 @@ class OneToOnePartitioner(Partitioner):
     def flush_marker(
         self, marker: Marker
     ) -> Iterator[
-        typing.Tuple[ActorVirtualIdentity, typing.Union[Marker, typing.List[Tuple]]]
+        typing.Tuple[ActorVirtualIdentity, typing.Union[Marker, ColumnarBatch]]
     ]:
         if len(self.batch) > 0:
             yield self.receiver, self.batch
@@ -71,4 +85,4 @@ class OneToOnePartitioner(Partitioner):
 
     @overrides
     def reset(self) -> None:
-        self.batch = list()
+        self.batch = ColumnarBatch()
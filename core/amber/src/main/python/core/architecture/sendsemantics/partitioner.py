@@ -17,11 +17,14 @@
 
 import typing
 from abc import ABC
-from typing import Iterator
+from typing import Iterator, List
 
+import numpy
+import pyarrow
 from betterproto import Message
 
-from core.models import Tuple
+from core.architecture.sendsemantics.columnar_batch import ColumnarBatch
+from core.models import Tuple, Schema
 from core.models.marker import Marker
 from core.util import get_one_of
 from proto.edu.uci.ics.amber.engine.architecture.sendsemantics import Partitioning
@@ -34,18 +37,36 @@ class Partitioner(ABC):
 
     def add_tuple_to_batch(
         self, tuple_: Tuple
-    ) -> Iterator[typing.Tuple[ActorVirtualIdentity, typing.List[Tuple]]]:
+    ) -> Iterator[typing.Tuple[ActorVirtualIdentity, ColumnarBatch]]:
         pass
 
+    def add_arrow_batch(
+        self, batch: pyarrow.Table, schema: Schema
+    ) -> Iterator[
+        typing.Tuple[ActorVirtualIdentity, typing.Union[pyarrow.Table, ColumnarBatch]]
+    ]:
+        """
+        Partition a batch of rows, produced as a whole by an ArrowBatchOperator.
+        The default implementation adds the rows one by one as Tuples, the
+        partitioners capable of sending slices of the batch as they are should
+        override it.
+
+        :param batch: pyarrow.Table, conformed to the given schema.
+        :param schema: the Schema of the output port.
+        :return: Iterator of receivers and their pyarrow.Tables or Tuple batches.
+        """
+        for row in batch.to_pylist():
+            yield from self.add_tuple_to_batch(Tuple(row, schema=schema))
+
     def flush(
         self, to: ActorVirtualIdentity, marker: Marker
-    ) -> Iterator[typing.Union[Marker, typing.List[Tuple]]]:
+    ) -> Iterator[typing.Union[Marker, ColumnarBatch]]:
         pass
 
     def flush_marker(
         self, marker: Marker
     ) -> Iterator[
-        typing.Tuple[ActorVirtualIdentity, typing.Union[Marker, typing.List[Tuple]]]
+        typing.Tuple[ActorVirtualIdentity, typing.Union[Marker, ColumnarBatch]]
     ]:
         pass
 
@@ -54,3 +75,40 @@ class Partitioner(ABC):
 
     def __repr__(self):
         return f"Partitioner[partitioning={self.partitioning}]"
+
+
+def partition_arrow_batch(
+    batch: pyarrow.Table,
+    receiver_indices: numpy.ndarray,
+    receivers: List[typing.Tuple[ActorVirtualIdentity, ColumnarBatch]],
+    batch_size: int,
+) -> Iterator[
+    typing.Tuple[ActorVirtualIdentity, typing.Union[pyarrow.Table, ColumnarBatch]]
+]:
+    """
+    Split a batch into per-receiver slices with a single take, preserving the
+    order of rows sent to each receiver. A receiver's pending Tuples are sent
+    before its first slice, so that rows are delivered in the order they were
+    added.
+
+    :param batch: pyarrow.Table to be partitioned.
+    :param receiver_indices: the index of the receiver of each row, in receivers.
+    :param receivers: the receivers, with their pending Tuple batches.
+    :param batch_size: the maximum number of rows of a slice.
+    :return: Iterator of receivers and their pyarrow.Tables or Tuple batches.
+    """
+    order = numpy.argsort(receiver_indices, kind="stable")
+    counts = numpy.bincount(receiver_indices, minlength=len(receivers))
+    grouped = batch.take(order)
+    offset = 0
+    for index, count in enumerate(counts.tolist()):
+        if count == 0:
+            continue
+        receiver, pending = receivers[index]
+        if len(pending) > 0:
+            yield receiver, pending
+            receivers[index] = (receiver, ColumnarBatch())
+        rows = grouped.slice(offset, count)
+        for start in range(0, count, batch_size):
+            yield receiver, rows.slice(start, batch_size)
+        offset += count
@@ -18,11 +18,18 @@
 import typing
 from typing import Iterator
 
+import numpy
+import pyarrow
+import pyarrow.compute
 from loguru import logger
 from overrides import overrides
 
-from core.architecture.sendsemantics.partitioner import Partitioner
-from core.models import Tuple
+from core.architecture.sendsemantics.columnar_batch import ColumnarBatch
+from core.architecture.sendsemantics.partitioner import (
+    Partitioner,
+    partition_arrow_batch,
+)
+from core.models import Tuple, Schema
 from core.models.marker import Marker
 from core.util import set_one_of
 from proto.edu.uci.ics.amber.engine.architecture.sendsemantics import (
@@ -38,7 +45,7 @@ class RangeBasedShufflePartitioner(Partitioner):
         logger.info(f"got {partitioning}")
         self.batch_size = partitioning.batch_size
         self.receivers = [
-            (receiver, [])
+            (receiver, ColumnarBatch())
             for receiver in {channel.to_worker_id for channel in partitioning.channels}
         ]
         self.range_attribute_names = partitioning.range_attribute_names
@@ -63,32 +70,72 @@ class RangeBasedShufflePartitioner(Partitioner):
     @overrides
     def add_tuple_to_batch(
         self, tuple_: Tuple
-    ) -> Iterator[typing.Tuple[ActorVirtualIdentity, typing.List[Tuple]]]:
+    ) -> Iterator[typing.Tuple[ActorVirtualIdentity, ColumnarBatch]]:
         column_val = tuple_[self.range_attribute_names[0]]
         receiver_index = self.get_receiver_index(column_val)
         receiver, batch = self.receivers[receiver_index]
         batch.append(tuple_)
         if len(batch) == self.batch_size:
             yield receiver, batch
-            self.receivers[receiver_index] = (receiver, list())
+            self.receivers[receiver_index] = (receiver, ColumnarBatch())
+
+    def get_receiver_indices(self, column: pyarrow.ChunkedArray) -> numpy.ndarray:
+        values = column.to_numpy()
+        if values.dtype.kind in "iu":
+            values = values.astype(numpy.int64)
+        indices = numpy.floor_divide(
+            numpy.clip(values, self.range_min, self.range_max) - self.range_min,
+            self.keys_per_receiver,
+        ).astype(numpy.int64)
+        indices[values < self.range_min] = 0
+        indices[values > self.range_max] = len(self.receivers) - 1
+        return indices
+
+    @staticmethod
+    def can_bucket(column: pyarrow.ChunkedArray) -> bool:
+        if column.null_count > 0:
+            return False
+        if pyarrow.types.is_integer(column.type):
+            return True
+        return (
+            pyarrow.types.is_floating(column.type)
+            and not pyarrow.compute.any(pyarrow.compute.is_nan(column)).as_py()
+        )
+
+    @overrides
+    def add_arrow_batch(
+        self, batch: pyarrow.Table, schema: Schema
+    ) -> Iterator[
+        typing.Tuple[ActorVirtualIdentity, typing.Union[pyarrow.Table, ColumnarBatch]]
+    ]:
+        column = batch.column(self.range_attribute_names[0])
+        if not self.can_bucket(column):
+            # nulls, NaNs and non-numeric values keep the per-Tuple behavior.
+            yield from super().add_arrow_batch(batch, schema)
+            return
+        yield from partition_arrow_batch(
+            batch, self.get_receiver_indices(column), self.receivers, self.batch_size
+        )
 
     @overrides
     def flush(
         self, to: ActorVirtualIdentity, marker: Marker
-    ) -> Iterator[typing.Union[Marker, typing.List[Tuple]]]:
+    ) -> Iterator[typing.Union[Marker, ColumnarBatch]]:
         for receiver, batch in self.receivers:
             if receiver == to:
                 if len(batch) > 0:
                     yield batch
+                    batch.clear()
                 yield marker
 
     @overrides
     def flush_marker(
         self, marker: Marker
     ) -> Iterator[
-        typing.Tuple[ActorVirtualIdentity, typing.Union[Marker, typing.List[Tuple]]]
+        typing.Tuple[ActorVirtualIdentity, typing.Union[Marker, ColumnarBatch]]
     ]:
         for receiver, batch in self.receivers:
             if len(batch) > 0:
                 yield receiver, batch
+                batch.clear()
             yield receiver, marker
@@ -18,10 +18,12 @@
 import typing
 from typing import Iterator
 
+import pyarrow
 from overrides import overrides
 
+from core.architecture.sendsemantics.columnar_batch import ColumnarBatch
 from core.architecture.sendsemantics.partitioner import Partitioner
-from core.models import Tuple
+from core.models import Tuple, Schema
 from core.models.marker import Marker
 from core.util import set_one_of
 from proto.edu.uci.ics.amber.engine.architecture.sendsemantics import (
@@ -43,7 +45,7 @@ class RoundRobinPartitioner(Partitioner):
         # does not preserve order and will not work with input-port
         # materialization reader threads.)
         self.receivers = [
-            (rid, [])
+            (rid, ColumnarBatch())
             for rid in dict.fromkeys(
                 channel.to_worker_id for channel in partitioning.channels
             )
@@ -53,18 +55,34 @@ class RoundRobinPartitioner(Partitioner):
     @overrides
     def add_tuple_to_batch(
         self, tuple_: Tuple
-    ) -> Iterator[typing.Tuple[ActorVirtualIdentity, typing.List[Tuple]]]:
+    ) -> Iterator[typing.Tuple[ActorVirtualIdentity, ColumnarBatch]]:
         receiver, batch = self.receivers[self.round_robin_index]
         batch.append(tuple_)
         if len(batch) == self.batch_size:
             yield receiver, batch
-            self.receivers[self.round_robin_index] = (receiver, list())
+            self.receivers[self.round_robin_index] = (receiver, ColumnarBatch())
         self.round_robin_index = (self.round_robin_index + 1) % len(self.receivers)
 
+    @overrides
+    def add_arrow_batch(
+        self, batch: pyarrow.Table, schema: Schema
+    ) -> Iterator[
+        typing.Tuple[ActorVirtualIdentity, typing.Union[pyarrow.Table, ColumnarBatch]]
+    ]:
+        # slices of the batch, instead of single rows, are sent in turns. The
+        # pending Tuples of a receiver are sent before its slice to keep the order.
+        for offset in range(0, batch.num_rows, self.batch_size):
+            receiver, pending_batch = self.receivers[self.round_robin_index]
+            if len(pending_batch) > 0:
+                yield receiver, pending_batch
+                self.receivers[self.round_robin_index] = (receiver, ColumnarBatch())
+            yield receiver, batch.slice(offset, self.batch_size)
+            self.round_robin_index = (self.round_robin_index + 1) % len(self.receivers)
+
     @overrides
     def flush(
         self, to: ActorVirtualIdentity, marker: Marker
-    ) -> Iterator[typing.Union[Marker, typing.List[Tuple]]]:
+    ) -> Iterator[typing.Union[Marker, ColumnarBatch]]:
         for receiver, batch in self.receivers:
             if receiver == to:
                 if len(batch) > 0:
@@ -76,7 +94,7 @@ class RoundRobinPartitioner(Partitioner):
     def flush_marker(
         self, marker: Marker
     ) -> Iterator[
-        typing.Tuple[ActorVirtualIdentity, typing.Union[Marker, typing.List[Tuple]]]
+        typing.Tuple[ActorVirtualIdentity, typing.Union[Marker, ColumnarBatch]]
     ]:
         for receiver, batch in self.receivers:
             if len(batch) > 0:
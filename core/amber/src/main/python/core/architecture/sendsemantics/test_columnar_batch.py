@@ -0,0 +1,54 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import pyarrow
+import pytest
+
+from core.architecture.sendsemantics.columnar_batch import ColumnarBatch
+from core.models import Schema, Tuple
+
+
+class TestColumnarBatch:
+    @pytest.fixture
+    def schema(self):
+        return Schema(raw_schema={"x": "INTEGER", "y": "STRING"})
+
+    def test_columnar_batch_converts_to_arrow_table(self, schema):
+        batch = ColumnarBatch()
+        for i in range(3):
+            # field order of a Tuple may differ from the schema.
+            tuple_ = Tuple({"y": str(i), "x": i})
+            tuple_.finalize(schema)
+            batch.append(tuple_)
+        assert len(batch) == 3
+
+        table = batch.to_arrow_table(schema.as_arrow_schema())
+        assert table.schema == schema.as_arrow_schema()
+        assert table.to_pydict() == {"x": [0, 1, 2], "y": ["0", "1", "2"]}
+
+    def test_columnar_batch_can_be_cleared(self, schema):
+        batch = ColumnarBatch()
+        tuple_ = Tuple({"x": 1, "y": "a"})
+        tuple_.finalize(schema)
+        batch.append(tuple_)
+        batch.clear()
+        assert len(batch) == 0
+
+        table = batch.to_arrow_table(schema.as_arrow_schema())
+        assert table.num_rows == 0
+        assert table.schema == pyarrow.schema(
+            [("x", pyarrow.int32()), ("y", pyarrow.string())]
+        )
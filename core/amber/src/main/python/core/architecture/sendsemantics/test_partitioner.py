@@ -0,0 +1,165 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from collections import defaultdict
+from itertools import chain
+
+import pyarrow
+import pytest
+
+from core.architecture.sendsemantics.columnar_batch import ColumnarBatch
+from core.architecture.sendsemantics.hash_based_shuffle_partitioner import (
+    HashBasedShufflePartitioner,
+)
+from core.architecture.sendsemantics.range_based_shuffle_partitioner import (
+    RangeBasedShufflePartitioner,
+)
+from core.models import Schema, Tuple
+from core.models.marker import EndOfInputChannel
+from proto.edu.uci.ics.amber.core import ActorVirtualIdentity, ChannelIdentity
+from proto.edu.uci.ics.amber.engine.architecture.sendsemantics import (
+    HashBasedShufflePartitioning,
+    RangeBasedShufflePartitioning,
+)
+
+
+class TestPartitioner:
+    @pytest.fixture
+    def schema(self):
+        return Schema(raw_schema={"id": "INTEGER", "score": "DOUBLE", "name": "STRING"})
+
+    @pytest.fixture
+    def table(self, schema):
+        return pyarrow.Table.from_pylist(
+            [
+                {"id": i, "score": i * 1.5 - 20, "name": f"name-{i % 7}"}
+                for i in range(-5, 45)
+            ],
+            schema=schema.as_arrow_schema(),
+        )
+
+    @pytest.fixture
+    def channels(self):
+        return [
+            ChannelIdentity(
+                ActorVirtualIdentity("sender"),
+                ActorVirtualIdentity(f"receiver-{i}"),
+                False,
+            )
+            for i in range(3)
+        ]
+
+    @staticmethod
+    def rows_per_receiver(outputs, schema):
+        rows = defaultdict(list)
+        for receiver, payload in outputs:
+            if isinstance(payload, ColumnarBatch):
+                payload = payload.to_arrow_table(schema.as_arrow_schema())
+            if isinstance(payload, pyarrow.Table):
+                assert 0 < payload.num_rows <= 4
+                rows[receiver.name].extend(payload.to_pylist())
+        return rows
+
+    def partition_as_tuples(self, partitioner, table, schema):
+        # batches are reused once sent, so they are consumed as they come.
+        outputs = chain(
+            *(
+                partitioner.add_tuple_to_batch(Tuple(row, schema=schema))
+                for row in table.to_pylist()
+            ),
+            partitioner.flush_marker(EndOfInputChannel()),
+        )
+        return self.rows_per_receiver(outputs, schema)
+
+    def partition_as_batch(self, partitioner, table, schema):
+        outputs = chain(
+            partitioner.add_arrow_batch(table, schema),
+            partitioner.flush_marker(EndOfInputChannel()),
+        )
+        return self.rows_per_receiver(outputs, schema)
+
+    @pytest.mark.parametrize("hash_attribute_names", [[], ["name"], ["score", "id"]])
+    def test_hash_partitioner_routes_batch_as_tuples(
+        self, table, schema, channels, hash_attribute_names
+    ):
+        partitioning = HashBasedShufflePartitioning(
+            batch_size=4, channels=channels, hash_attribute_names=hash_attribute_names
+        )
+        expected = self.partition_as_tuples(
+            HashBasedShufflePartitioner(partitioning), table, schema
+        )
+        assert len(expected) > 1
+        assert (
+            self.partition_as_batch(
+                HashBasedShufflePartitioner(partitioning), table, schema
+            )
+            == expected
+        )
+
+    @pytest.mark.parametrize("range_attribute_name", ["id", "score", "name"])
+    def test_range_partitioner_routes_batch_as_tuples(
+        self, table, schema, channels, range_attribute_name
+    ):
+        partitioning = RangeBasedShufflePartitioning(
+            batch_size=4,
+            channels=channels,
+            range_attribute_names=[range_attribute_name],
+            range_min=0,
+            range_max=30,
+        )
+        if range_attribute_name == "name":
+            # strings cannot be compared to the range, neither as Tuples.
+            with pytest.raises(TypeError):
+                self.partition_as_batch(
+                    RangeBasedShufflePartitioner(partitioning), table, schema
+                )
+            return
+        expected = self.partition_as_tuples(
+            RangeBasedShufflePartitioner(partitioning), table, schema
+        )
+        assert len(expected) == 3
+        assert (
+            self.partition_as_batch(
+                RangeBasedShufflePartitioner(partitioning), table, schema
+            )
+            == expected
+        )
+
+    def test_pending_tuples_are_sent_before_batch(self, table, schema, channels):
+        partitioner = HashBasedShufflePartitioner(
+            HashBasedShufflePartitioning(batch_size=4, channels=channels)
+        )
+        first = table.slice(0, 1)
+        list(partitioner.add_tuple_to_batch(Tuple(first.to_pylist()[0], schema=schema)))
+        outputs = list(partitioner.add_arrow_batch(first, schema))
+        assert len(outputs) == 2
+        assert isinstance(outputs[0][1], ColumnarBatch)
+        assert isinstance(outputs[1][1], pyarrow.Table)
+        assert outputs[0][0] == outputs[1][0]
+
+    def test_flush_marker_clears_pending_tuples(self, table, schema, channels):
+        partitioner = HashBasedShufflePartitioner(
+            HashBasedShufflePartitioning(batch_size=4, channels=channels)
+        )
+        list(partitioner.add_tuple_to_batch(Tuple(table.to_pylist()[0], schema=schema)))
+        first = self.rows_per_receiver(
+            partitioner.flush_marker(EndOfInputChannel()), schema
+        )
+        second = self.rows_per_receiver(
+            partitioner.flush_marker(EndOfInputChannel()), schema
+        )
+        assert sum(map(len, first.values())) == 1
+        assert sum(map(len, second.values())) == 0
@@ -0,0 +1,80 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import os
+
+
+class WorkerConfig:
+    """
+    A static class to keep the execution-related configs of a Python worker.
+
+    Each config comes with a default value, which can be overridden by an
+    environment variable of the same name prefixed with `TEXERA_PYTHON_WORKER_`,
+    e.g., `TEXERA_PYTHON_WORKER_DATA_PROCESSOR_SLICE_SIZE=1024`. The environment
+    is inherited from the process that launches the Python worker.
+    """
+
+    ENV_PREFIX = "TEXERA_PYTHON_WORKER_"
+
+    # Number of input tuples handed from the MainLoop to the DataProcessor in one
+    # context switch. 1 keeps the tuple-at-a-time hand-off; 0 hands over a whole
+    # DataFrame payload at once.
+    DATA_PROCESSOR_SLICE_SIZE: int = 1
+
+    # When slicing is enabled, the maximum number of output tuples the
+    # DataProcessor buffers before handing them back to the MainLoop.
+    DATA_PROCESSOR_MAX_BUFFERED_OUTPUTS: int = 4096
+
+    # Whether to run the executor inline on the MainLoop thread instead of on a
+    # dedicated DataProcessor thread. The worker falls back to the threaded
+    # execution once a debug command is received.
+    COOPERATIVE_EXECUTION: bool = False
+
+    # Whether to size Tuples for the byte statistics by measuring the deep size of
+    # a sample of them, instead of estimating their size in Arrow buffers.
+    TUPLE_SIZE_SAMPLING: bool = False
+
+    # When sampling, the bound on the relative standard error of the mean Tuple
+    # size of a port, under which Tuples are only measured once in an interval.
+    TUPLE_SIZE_SAMPLING_MAX_ERROR: float = 0.05
+    TUPLE_SIZE_SAMPLING_INTERVAL: int = 1000
+
+    # Bytes of input data the worker may queue before all the senders are reported
+    # out of credits, bounding the memory used by the input queue even when many
+    # senders are within their own credits. 0 leaves the queue unbounded.
+    INPUT_QUEUE_MEMORY_BUDGET: int = 0
+
+    @classmethod
+    def load_from_env(cls) -> None:
+        """
+        Overrides the default configs with the values found in the environment
+        variables. The value is converted to the type of the default value.
+        """
+        for name, value_type in cls.__annotations__.items():
+            raw_value = os.environ.get(cls.ENV_PREFIX + name)
+            if raw_value is None:
+                continue
+            if value_type is bool:
+                setattr(cls, name, raw_value.strip().lower() in ("1", "true", "yes"))
+            else:
+                setattr(cls, name, value_type(raw_value))
+
+    def __new__(cls, *args, **kwargs):
+        raise TypeError(f"{cls.__name__} is a static class and cannot be instantiated.")
+
+
+WorkerConfig.load_from_env()
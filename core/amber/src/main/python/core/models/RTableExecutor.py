@@ -22,7 +22,7 @@ from rpy2.robjects import default_converter
 from rpy2.robjects.conversion import localconverter as local_converter
 import typing
 from typing import Iterator, Optional, Union
-from core.models import ArrowTableTupleProvider, Tuple, TupleLike, Table, TableLike
+from core.models import ArrowRowView, Tuple, TupleLike, Table, TableLike
 from core.models.operator import SourceOperator, TableOperator
 
 
@@ -77,10 +77,8 @@ class RTableExecutor(TableOperator):
             )
             output_pyarrow_table = rarrow_to_py_table(output_rarrow_table)
 
-        for field_accessor in ArrowTableTupleProvider(output_pyarrow_table):
-            yield Tuple(
-                {name: field_accessor for name in output_pyarrow_table.column_names}
-            )
+        for row_view in ArrowRowView.iter_rows(output_pyarrow_table):
+            yield Tuple(row_view)
 
 
 class RTableSourceExecutor(SourceOperator):
@@ -125,7 +123,5 @@ class RTableSourceExecutor(SourceOperator):
             )
             output_pyarrow_table = rarrow_to_py_table(output_rarrow_table)
 
-        for field_accessor in ArrowTableTupleProvider(output_pyarrow_table):
-            yield Tuple(
-                {name: field_accessor for name in output_pyarrow_table.column_names}
-            )
+        for row_view in ArrowRowView.iter_rows(output_pyarrow_table):
+            yield Tuple(row_view)
@@ -20,7 +20,7 @@ from typing import NamedTuple
 
 from .internal_queue import InternalQueue
 from .internal_marker import InternalMarker
-from .tuple import Tuple, TupleLike, ArrowTableTupleProvider
+from .tuple import Tuple, TupleLike, ArrowTableTupleProvider, ArrowRowView
 from .table import Table, TableLike
 from .batch import Batch, BatchLike
 from .schema import AttributeType, Field, Schema
@@ -30,6 +30,7 @@ from .operator import (
     TableOperator,
     TupleOperatorV2,
     BatchOperator,
+    ArrowBatchOperator,
     SourceOperator,
 )
 from .payload import DataFrame, DataPayload, MarkerFrame
@@ -48,6 +49,7 @@ __all__ = [
     "Tuple",
     "TupleLike",
     "ArrowTableTupleProvider",
+    "ArrowRowView",
     "Table",
     "TableLike",
     "Batch",
@@ -56,6 +58,7 @@ __all__ = [
     "TupleOperatorV2",
     "TableOperator",
     "BatchOperator",
+    "ArrowBatchOperator",
     "SourceOperator",
     "DataFrame",
     "DataPayload",
@@ -17,13 +17,15 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from enum import Enum
 from threading import RLock
-from typing import TypeVar, Set
+from typing import Optional, TypeVar, Set
 
+from core.architecture.worker_config import WorkerConfig
 from core.models.internal_marker import InternalMarker
-from core.models.payload import DataPayload
+from core.models.payload import DataFrame, DataPayload
 from core.util.customized_queue.linked_blocking_multi_queue import (
     LinkedBlockingMultiQueue,
 )
@@ -62,13 +64,38 @@ class InternalQueue(IQueue):
         DISABLE_BY_PAUSE = 1
         DISABLE_BY_BACKPRESSURE = 2
 
-    def __init__(self):
-        self._queue = LinkedBlockingMultiQueue()
+    # the credits reported once the memory budget is exceeded, which exhaust the
+    # credits of any sender, while leaving room for a sender to add its own queued
+    # bytes to it without overflowing a Java long.
+    EXHAUSTED_CREDIT = 1 << 62
+
+    def __init__(self, memory_budget: Optional[int] = None):
+        """
+        :param memory_budget: the bytes of data the queue may hold before the
+            senders are reported out of credits, 0 for no budget. Defaults to
+            WorkerConfig.INPUT_QUEUE_MEMORY_BUDGET.
+        """
+        self._memory_budget: int = (
+            WorkerConfig.INPUT_QUEUE_MEMORY_BUDGET
+            if memory_budget is None
+            else memory_budget
+        )
+        self._queue = LinkedBlockingMultiQueue(sizer=self._get_in_mem_size)
         self._queue.add_sub_queue("SYSTEM", 0)
         self._queue_ids: Set[ChannelIdentity] = set()
         self._queue_state: Set[InternalQueue.DisableType] = set()
         self._lock = RLock()
 
+    @staticmethod
+    def _get_in_mem_size(item: T) -> int:
+        """
+        The in-memory size of an element, which is the size of the Arrow buffers
+        for a DataFrame, as the element itself only holds a reference to them.
+        """
+        if isinstance(item, DataElement) and isinstance(item.payload, DataFrame):
+            return item.payload.frame.nbytes
+        return sys.getsizeof(item)
+
     def is_empty(self, key=None) -> bool:
         return self._queue.is_empty(key)
 
@@ -154,6 +181,19 @@ class InternalQueue(IQueue):
             if not queue_id.is_control
         )
 
+    def get_sender_credit(self) -> int:
+        """
+        The credits used by the data in the queue, reported to the senders on
+        each message for flow control. Once the data queued exceed the memory
+        budget, the credits of all senders are reported exhausted, until the queue
+        is drained back within the budget.
+        :return: The used credits in bytes.
+        """
+        in_mem_size = self.in_mem_size()
+        if 0 < self._memory_budget < in_mem_size:
+            return InternalQueue.EXHAUSTED_CREDIT
+        return in_mem_size
+
     def is_data_enabled(self) -> bool:
         return any(
             self._queue.is_enabled(queue_id)
@@ -21,6 +21,7 @@ from typing import Iterator, List, Mapping, Optional, Union, MutableMapping
 
 import overrides
 import pandas
+import pyarrow
 
 
 from . import Table, TableLike, Tuple, TupleLike, Batch, BatchLike
@@ -220,6 +221,40 @@ class BatchOperator(TupleOperatorV2):
         yield
 
 
+class ArrowBatchOperator(Operator):
+    """
+    Base class for Arrow-native batch-oriented operators. Each input data frame is
+    handed over as a whole pyarrow.Table, without being converted into Tuples, and
+    the produced pyarrow.Tables are sent to the downstream workers as they are.
+    A concrete implementation must be provided upon using.
+    """
+
+    @abstractmethod
+    def process_arrow_batch(
+        self, batch: pyarrow.Table, port: int
+    ) -> Iterator[Optional[pyarrow.Table]]:
+        """
+        Process an input batch from the given link. The batch is represented as a
+        pyarrow.Table.
+
+        :param batch: pyarrow.Table, a batch to be processed.
+        :param port: int, input port index of the current batch.
+        :return: Iterator[Optional[pyarrow.Table]], producing one pyarrow.Table
+            object at a time, or None.
+        """
+        yield
+
+    def on_finish(self, port: int) -> Iterator[Optional[pyarrow.Table]]:
+        """
+        Callback when one input port is exhausted.
+
+        :param port: int, input port index of the current exhausted port.
+        :return: Iterator[Optional[pyarrow.Table]], producing one pyarrow.Table
+            object at a time, or None.
+        """
+        yield
+
+
 class TableOperator(TupleOperatorV2):
     """
     Base class for table-oriented operators. A concrete implementation must
@@ -0,0 +1,77 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import pyarrow
+import pytest
+
+from core.models import DataFrame, InternalQueue, MarkerFrame
+from core.models.internal_queue import DataElement, ControlElement
+from core.models.marker import EndOfInputChannel
+from proto.edu.uci.ics.amber.core import ActorVirtualIdentity, ChannelIdentity
+from proto.edu.uci.ics.amber.engine.common import ControlPayloadV2
+
+
+class TestInternalQueue:
+    @pytest.fixture
+    def data_channel(self):
+        return ChannelIdentity(
+            ActorVirtualIdentity("sender"), ActorVirtualIdentity("receiver"), False
+        )
+
+    @pytest.fixture
+    def control_channel(self):
+        return ChannelIdentity(
+            ActorVirtualIdentity("sender"), ActorVirtualIdentity("receiver"), True
+        )
+
+    @pytest.fixture
+    def frame(self):
+        return pyarrow.Table.from_pydict({"x": list(range(10_000))})
+
+    def test_data_frames_are_sized_by_arrow_buffers(self, data_channel, frame):
+        queue = InternalQueue()
+        queue.put(DataElement(tag=data_channel, payload=DataFrame(frame)))
+        assert queue.in_mem_size() == frame.nbytes
+        queue.put(
+            DataElement(tag=data_channel, payload=MarkerFrame(EndOfInputChannel()))
+        )
+        assert frame.nbytes < queue.in_mem_size() < 2 * frame.nbytes
+        queue.get()
+        queue.get()
+        assert queue.in_mem_size() == 0
+
+    def test_control_is_not_counted_as_credit(self, control_channel):
+        queue = InternalQueue()
+        queue.put(ControlElement(tag=control_channel, payload=ControlPayloadV2()))
+        assert queue.get_sender_credit() == 0
+
+    def test_credit_is_exhausted_beyond_memory_budget(self, data_channel, frame):
+        queue = InternalQueue(memory_budget=frame.nbytes * 2)
+        for _ in range(2):
+            queue.put(DataElement(tag=data_channel, payload=DataFrame(frame)))
+        assert queue.get_sender_credit() == 2 * frame.nbytes
+
+        queue.put(DataElement(tag=data_channel, payload=DataFrame(frame)))
+        assert queue.get_sender_credit() == InternalQueue.EXHAUSTED_CREDIT
+
+        queue.get()
+        assert queue.get_sender_credit() == 2 * frame.nbytes
+
+    def test_no_memory_budget(self, data_channel, frame):
+        queue = InternalQueue(memory_budget=0)
+        for _ in range(3):
+            queue.put(DataElement(tag=data_channel, payload=DataFrame(frame)))
+        assert queue.get_sender_credit() == 3 * frame.nbytes
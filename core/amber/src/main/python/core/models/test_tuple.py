@@ -17,13 +17,16 @@
 
 import datetime
 
+import pickle
+
 import pandas
 import pytest
 from copy import deepcopy
 import pyarrow
 from numpy import NaN
 
-from core.models import Tuple, ArrowTableTupleProvider
+from core.models import Tuple, ArrowTableTupleProvider, ArrowRowView
+from core.models.tuple import java_hash_columns
 from core.models.schema.schema import Schema
 
 
@@ -122,6 +125,64 @@ class TestTuple:
         ]
         assert tuples == []
 
+    @pytest.fixture
+    def multi_chunk_arrow_table(self):
+        arrow_table = pyarrow.Table.from_pydict(
+            {
+                "x": [1, 2, 3],
+                "y": ["a", "b", "c"],
+                "z": [b"pickle    " + pickle.dumps([i]) for i in range(3)],
+            }
+        )
+        return pyarrow.Table.from_batches(arrow_table.to_batches(max_chunksize=2))
+
+    def test_tuple_lazy_get_from_arrow_row_view(self, multi_chunk_arrow_table):
+        tuples = [
+            Tuple(row_view)
+            for row_view in ArrowRowView.iter_rows(multi_chunk_arrow_table)
+        ]
+        assert len(tuples) == 3
+        assert tuples[2].get_field_names() == ("x", "y", "z")
+        assert len(tuples[2]) == 3
+        assert "y" in tuples[2]
+        assert tuples[2]["y"] == "c"
+        assert tuples[2][0] == 3
+        assert tuples == [
+            Tuple({"x": 1, "y": "a", "z": [0]}),
+            Tuple({"x": 2, "y": "b", "z": [1]}),
+            Tuple({"x": 3, "y": "c", "z": [2]}),
+        ]
+
+    def test_tuple_from_arrow_row_view_keeps_references(self, multi_chunk_arrow_table):
+        tuple_ = Tuple(next(ArrowRowView.iter_rows(multi_chunk_arrow_table)))
+        # the unpickled object is kept once referenced.
+        tuple_["z"].append(1)
+        assert tuple_["z"] == [0, 1]
+
+        # another Tuple of the same row gets its own object.
+        copied_tuple = deepcopy(tuple_)
+        copied_tuple["z"].append(2)
+        assert tuple_["z"] == [0, 1]
+        assert Tuple(next(ArrowRowView.iter_rows(multi_chunk_arrow_table)))["z"] == [0]
+
+    def test_tuple_from_arrow_row_view_can_be_modified(self, multi_chunk_arrow_table):
+        tuple_ = Tuple(next(ArrowRowView.iter_rows(multi_chunk_arrow_table)))
+        assert tuple_["y"] == "a"
+        tuple_["w"] = 1.1
+        tuple_["x"] = 3
+        assert tuple_.as_key_value_pairs() == [
+            ("x", 3),
+            ("y", "a"),
+            ("z", [0]),
+            ("w", 1.1),
+        ]
+
+    def test_retrieve_tuple_view_from_empty_arrow_table(self):
+        arrow_table = pyarrow.schema([]).empty_table()
+        assert list(ArrowRowView.iter_rows(arrow_table)) == []
+        arrow_table = pyarrow.schema([("x", pyarrow.int64())]).empty_table()
+        assert list(ArrowRowView.iter_rows(arrow_table)) == []
+
     def test_finalize_tuple(self):
         tuple_ = Tuple(
             {"name": "texera", "age": 21, "scores": [85, 94, 100], "height": NaN}
@@ -222,3 +283,56 @@ class TestTuple:
             schema,
         )
         assert hash(tuple5) == -2099556631  # calculated with Java
+
+    def test_java_hash_columns_matches_tuple_hash(self):
+        schema = Schema(
+            raw_schema={
+                "col-int": "INTEGER",
+                "col-string": "STRING",
+                "col-bool": "BOOLEAN",
+                "col-long": "LONG",
+                "col-double": "DOUBLE",
+                "col-timestamp": "TIMESTAMP",
+                "col-binary": "BINARY",
+            }
+        )
+        rows = [
+            [922323, "string-attr", True, 1123213213213, 214214.9969346, 1e8, b"hi"],
+            [0, "", False, 0, 0.0, 0, b""],
+            [None, None, None, None, None, None, None],
+            [-3245763, "\n\r\napple", True, -8965536434247, 1 / 3, -1990, None],
+            [0x7FFFFFFF, "", True, 0x7FFFFFFFFFFFFFFF, 7 / 17, 1234567890, b"o" * 97],
+            [-1, "caf\u00e9 \U0001f600", None, -1, -0.5, 1.5, b"\x00\xff"],
+        ]
+        table = pyarrow.Table.from_pylist(
+            [
+                {
+                    name: (
+                        datetime.datetime.fromtimestamp(value)
+                        if name == "col-timestamp" and value is not None
+                        else value
+                    )
+                    for name, value in zip(schema.get_attr_names(), row)
+                }
+                for row in rows
+            ],
+            schema=schema.as_arrow_schema(),
+        )
+        tuples = [Tuple(row, schema=schema) for row in table.to_pylist()]
+
+        hash_codes = java_hash_columns(
+            table.columns,
+            [schema.get_attr_type(name) for name in table.column_names],
+            table.num_rows,
+        )
+        assert hash_codes.tolist() == [tuple_.__hash__() for tuple_ in tuples]
+
+        names = ["col-binary", "col-string"]
+        hash_codes = java_hash_columns(
+            [table.column(name) for name in names],
+            [schema.get_attr_type(name) for name in names],
+            table.num_rows,
+        )
+        assert hash_codes.tolist() == [
+            tuple_.get_partial_tuple(names).__hash__() for tuple_ in tuples
+        ]
@@ -16,13 +16,16 @@
 # under the License.
 
 import ctypes
+import datetime
 import struct
+import sys
 import typing
 from collections import OrderedDict
 from copy import deepcopy
-from typing import Any, List, Iterator, Callable
+from typing import Any, Dict, List, Iterator, Callable
 
 from typing_extensions import Protocol, runtime_checkable
+import numpy
 import pandas
 import pickle
 import pyarrow
@@ -42,6 +45,15 @@ class TupleLike(Protocol):
     def __setitem__(self, key: typing.Union[str, int], value: Field) -> None: ...
 
 
+def _unpickle_if_pickled(value: Any) -> Any:
+    """
+    Convert a pickled object, stored in a binary field, back to the object.
+    """
+    if value is not None and value[:6] == b"pickle":
+        return pickle.loads(value[10:])
+    return value
+
+
 class ArrowTableTupleProvider:
     """
     This class provides "view"s for tuple from a pyarrow.Table.
@@ -89,18 +101,106 @@ class ArrowTableTupleProvider:
             field_type = self._table.schema.field(field_name).type
 
             # for binary types, convert pickled objects back.
-            if (
-                field_type == pyarrow.binary()
-                and value is not None
-                and value[:6] == b"pickle"
-            ):
-                value = pickle.loads(value[10:])
+            if field_type == pyarrow.binary():
+                value = _unpickle_if_pickled(value)
             return value
 
         self._current_idx += 1
         return field_accessor
 
 
+class ArrowBatchColumns:
+    """
+    The columns of one pyarrow.RecordBatch, shared by all the row views of the
+    batch. The column arrays and their types are looked up once per batch, and the
+    values of a flat column are converted to Python objects in bulk upon the first
+    reference to the column.
+    """
+
+    def __init__(self, batch: pyarrow.RecordBatch):
+        self.field_names: typing.Tuple[str, ...] = tuple(batch.schema.names)
+        self.field_indices: Dict[str, int] = {
+            name: index for index, name in enumerate(self.field_names)
+        }
+        self._arrays: List[pyarrow.Array] = batch.columns
+        self._is_binary: List[bool] = [
+            field.type == pyarrow.binary() for field in batch.schema
+        ]
+        # nested values (e.g., lists) are mutable, thus converted per reference.
+        self._is_nested: List[bool] = [
+            pyarrow.types.is_nested(field.type) for field in batch.schema
+        ]
+        self._values: List[typing.Optional[List[Any]]] = [None] * len(self._arrays)
+        self.row_nbytes: int = batch.nbytes // batch.num_rows if batch.num_rows else 0
+
+    def get_value(self, column_index: int, row_index: int) -> Field:
+        if self._is_nested[column_index]:
+            return self._arrays[column_index][row_index].as_py()
+        values = self._values[column_index]
+        if values is None:
+            values = self._values[column_index] = self._arrays[column_index].to_pylist()
+        value = values[row_index]
+        if self._is_binary[column_index]:
+            # for binary types, convert pickled objects back.
+            value = _unpickle_if_pickled(value)
+        return value
+
+
+class ArrowRowView:
+    """
+    A compact, read-only view of one row in a pyarrow.RecordBatch, which only
+    keeps the reference to the columns of the batch and the row index.
+    """
+
+    __slots__ = ("_columns", "_row_index")
+
+    def __init__(self, columns: ArrowBatchColumns, row_index: int):
+        self._columns = columns
+        self._row_index = row_index
+
+    @staticmethod
+    def iter_rows(table: pyarrow.Table) -> Iterator["ArrowRowView"]:
+        """
+        Iterate through the rows of a pyarrow.Table, without copying its data.
+
+        :param table: a pyarrow.Table, possibly of multiple chunks.
+        :return: Iterator[ArrowRowView], one view per row, following the row order.
+        """
+        if table.num_columns == 0:
+            # empty table
+            return
+        for batch in table.to_batches():
+            columns = ArrowBatchColumns(batch)
+            for row_index in range(batch.num_rows):
+                yield ArrowRowView(columns, row_index)
+
+    def get_field_names(self) -> typing.Tuple[str, ...]:
+        return self._columns.field_names
+
+    def __getitem__(self, field_name: str) -> Field:
+        return self._columns.get_value(
+            self._columns.field_indices[field_name], self._row_index
+        )
+
+    def __contains__(self, field_name: object) -> bool:
+        return field_name in self._columns.field_indices
+
+    def __len__(self) -> int:
+        return len(self._columns.field_names)
+
+    def in_mem_size(self) -> int:
+        """
+        Estimate the in-memory size of the row, as its share of the batch.
+        :return: The size in bytes.
+        """
+        return self._columns.row_nbytes
+
+    def __deepcopy__(self, memo) -> "ArrowRowView":
+        # the view is read-only, and the values it provides are either immutable
+        # or converted upon each reference.
+        return self
+
+
 def double_to_long(value: float) -> int:
     """
     Convert a double value into a long value.
@@ -155,6 +255,134 @@ def java_hash_bytes(bytes: Iterator[int], init: int, salt: int):
     return h
 
 
+def _java_hash_sequences(
+    values: numpy.ndarray, lengths: numpy.ndarray, init: int
+) -> numpy.ndarray:
+    """
+    Java's hash function for many arrays of bytes (or chars) at once, with a salt
+    of 31. The hash of a sequence of length L is
+    init * 31^L + sum(values[i] * 31^(L-1-i)), all in 32-bit arithmetic.
+    :param values: The concatenation of all the sequences.
+    :param lengths: The length of each sequence.
+    :param init: An init hash value.
+    :return: The hash value of each sequence, in uint32.
+    """
+    ends = numpy.cumsum(lengths)
+    powers = numpy.full(int(lengths.max(initial=0)) + 1, 31, dtype=numpy.uint32)
+    powers[0] = 1
+    powers = numpy.cumprod(powers, dtype=numpy.uint32)
+    exponents = numpy.repeat(ends, lengths) - 1 - numpy.arange(len(values))
+    terms = values.astype(numpy.uint32) * powers[exponents]
+    hashes = numpy.uint32(init) * powers[lengths]
+    non_empty = lengths > 0
+    if non_empty.any():
+        starts = (ends - lengths)[non_empty]
+        hashes[non_empty] += numpy.add.reduceat(terms, starts, dtype=numpy.uint32)
+    return hashes
+
+
+def _java_hash_column(column: pyarrow.Array, attr_type: AttributeType) -> numpy.ndarray:
+    """
+    Java's hash function for each value of a column, aligned with the per-type
+    hash functions used by Tuple.__hash__. Nulls hash to 0.
+    :param column: A pyarrow.Array.
+    :param attr_type: The AttributeType of the column.
+    :return: The hash value of each value, in uint32.
+    """
+    if attr_type == AttributeType.STRING:
+        strings = column.fill_null("").to_pylist()
+        lengths = numpy.fromiter(map(len, strings), numpy.int64, len(strings))
+        chars = "".join(strings).encode("utf-32-le")
+        hashes = _java_hash_sequences(
+            numpy.frombuffer(chars, dtype=numpy.uint32), lengths, 0
+        )
+    elif attr_type == AttributeType.BINARY:
+        binaries = column.fill_null(b"").to_pylist()
+        lengths = numpy.fromiter(map(len, binaries), numpy.int64, len(binaries))
+        hashes = _java_hash_sequences(
+            numpy.frombuffer(b"".join(binaries), dtype=numpy.uint8), lengths, 1
+        )
+    elif attr_type == AttributeType.BOOL:
+        flags = column.fill_null(False).to_numpy(zero_copy_only=False)
+        hashes = numpy.where(flags, 1231, 1237).astype(numpy.uint32)
+    elif attr_type == AttributeType.INT:
+        hashes = column.fill_null(0).to_numpy().astype(numpy.int64)
+        hashes = hashes.astype(numpy.uint32)
+    else:
+        if attr_type == AttributeType.DOUBLE:
+            doubles = column.fill_null(0).to_numpy().astype(numpy.float64)
+            longs = doubles.view(numpy.uint64)
+        elif attr_type == AttributeType.TIMESTAMP:
+            # naive timestamps are interpreted in local time, as Tuple.__hash__
+            # does through datetime.timestamp().
+            longs = numpy.fromiter(
+                (0 if f is None else int(f.timestamp()) for f in column.to_pylist()),
+                numpy.int64,
+                len(column),
+            )
+        else:
+            longs = column.fill_null(0).to_numpy().astype(numpy.int64)
+        hashes = (longs ^ (longs >> 32)).astype(numpy.uint32)
+    if column.null_count > 0:
+        hashes[column.is_null().to_numpy(zero_copy_only=False)] = 0
+    return hashes
+
+
+def java_hash_columns(
+    columns: List[pyarrow.Array], attr_types: List[AttributeType], num_rows: int
+) -> numpy.ndarray:
+    """
+    Java's hash function for each row of a batch at once, bit-identical to
+    Tuple.__hash__ on a Tuple holding the same fields in the same order.
+    :param columns: The columns to hash, as pyarrow.Arrays or ChunkedArrays.
+    :param attr_types: The AttributeType of each column.
+    :param num_rows: The number of rows in the batch.
+    :return: The hash value of each row, in int32.
+    """
+    result = numpy.ones(num_rows, dtype=numpy.uint32)
+    for column, attr_type in zip(columns, attr_types):
+        if isinstance(column, pyarrow.ChunkedArray):
+            column = column.combine_chunks()
+        result = result * numpy.uint32(31) + _java_hash_column(column, attr_type)
+    return result.view(numpy.int32)
+
+
+_ARROW_FIXED_WIDTHS: Dict[AttributeType, int] = {
+    AttributeType.INT: 4,
+    AttributeType.LONG: 8,
+    AttributeType.DOUBLE: 8,
+    AttributeType.BOOL: 1,
+    AttributeType.TIMESTAMP: 8,
+}
+
+
+def _arrow_field_size(
+    field: Field, attr_type: typing.Optional[AttributeType] = None
+) -> int:
+    """
+    Estimate the size of a field value in Arrow buffers: the width of a
+    fixed-width type (allocated for nulls as well), or the data and offset of a
+    variable-width one.
+    :param field: A field value.
+    :param attr_type: The AttributeType of the field, inferred if not given.
+    :return: The size in bytes.
+    """
+    if attr_type in _ARROW_FIXED_WIDTHS:
+        return _ARROW_FIXED_WIDTHS[attr_type]
+    if field is None:
+        return 0
+    if isinstance(field, str):
+        return 4 + (len(field) if field.isascii() else len(field.encode()))
+    if isinstance(field, (bytes, bytearray)):
+        return 4 + len(field)
+    if isinstance(field, bool):
+        return 1
+    if isinstance(field, (int, float, datetime.datetime)):
+        return 8
+    # other objects are pickled into binaries.
+    return 4 + sys.getsizeof(field)
+
+
 class Tuple:
     """
     Lazy-Tuple implementation.
@@ -174,7 +402,13 @@ class Tuple:
         """
         assert len(tuple_like) != 0
         self._field_data: "OrderedDict[str, Field]"
-        if isinstance(tuple_like, Tuple):
+        # the row the fields are fetched from upon reference, if any.
+        self._row_view: typing.Optional[ArrowRowView] = None
+        if isinstance(tuple_like, ArrowRowView):
+            self._row_view = tuple_like
+            self._field_data = OrderedDict()
+        elif isinstance(tuple_like, Tuple):
+            tuple_like._materialize()
             self._field_data = tuple_like._field_data
         elif isinstance(tuple_like, pandas.Series):
             self._field_data = OrderedDict(tuple_like.to_dict())
@@ -197,6 +431,9 @@ class Tuple:
         if isinstance(item, int):
             item: str = self.get_field_names()[item]
 
+        if self._row_view is not None and item not in self._field_data:
+            self._field_data[item] = self._row_view[item]
+
         if (
             callable(self._field_data[item])
             and getattr(self._field_data[item], "__name__", "Unknown")
@@ -215,6 +452,7 @@ class Tuple:
         """
         assert isinstance(field_name, str), "field can only be set by name"
         assert not callable(field_value), "field cannot be of type callable"
+        self._materialize()
         self._field_data[field_name] = field_value
 
     def as_series(self) -> pandas.Series:
@@ -228,6 +466,7 @@ class Tuple:
         :return: dict with all the fields
         """
         # evaluate all the fields now
+        self._materialize()
         for i in self.get_field_names():
             self.__getitem__(i)
         return deepcopy(self._field_data)
@@ -236,6 +475,8 @@ class Tuple:
         return [(k, v) for k, v in self.as_dict().items()]
 
     def get_field_names(self) -> typing.Tuple[str]:
+        if self._row_view is not None:
+            return self._row_view.get_field_names()
         return tuple(map(str, self._field_data.keys()))
 
     def get_fields(self, output_field_names=None) -> typing.Tuple[Field, ...]:
@@ -369,9 +610,13 @@ class Tuple:
         return not self.__eq__(other)
 
     def __len__(self) -> int:
+        if self._row_view is not None:
+            return len(self._row_view)
         return len(self._field_data)
 
     def __contains__(self, __x: object) -> bool:
+        if self._row_view is not None:
+            return __x in self._row_view
         return __x in self._field_data
 
     def __hash__(self) -> int:
@@ -411,4 +656,38 @@ class Tuple:
         Calculate the in-memory size of the Tuple instance.
         :return: The size in bytes.
         """
+        if self._row_view is not None:
+            # avoid fetching all the fields only to measure them.
+            return asizeof.asizeof(self._field_data) + self._row_view.in_mem_size()
         return asizeof.asizeof(self)
+
+    def arrow_size(self) -> int:
+        """
+        Estimate the size of the Tuple as a row in Arrow buffers, which is far
+        cheaper than measuring its in-memory size. A Tuple viewing a row of a batch
+        takes its share of the batch.
+        :return: The size in bytes.
+        """
+        if self._row_view is not None:
+            return self._row_view.in_mem_size()
+        size = 0
+        for name, field in zip(self.get_field_names(), self.get_fields()):
+            attr_type = (
+                self._schema.get_attr_type(name) if self._schema is not None else None
+            )
+            size += _arrow_field_size(field, attr_type)
+        return size
+
+    def _materialize(self) -> None:
+        """
+        Fetch all the fields not yet referenced from the row view, if any, and
+        detach the Tuple from the view, so that the Tuple can be modified.
+        """
+        if self._row_view is None:
+            return
+        fetched = self._field_data
+        self._field_data = OrderedDict(
+            (name, fetched[name] if name in fetched else self._row_view[name])
+            for name in self._row_view.get_field_names()
+        )
+        self._row_view = None
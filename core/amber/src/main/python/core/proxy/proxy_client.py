@@ -15,8 +15,10 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import threading
+
 from loguru import logger
-from pyarrow import Table, Buffer
+from pyarrow import RecordBatch, Schema, Table, Buffer, py_buffer
 from pyarrow.flight import (
     Action,
     FlightCallOptions,
@@ -28,6 +30,102 @@ from pyarrow.flight import (
 from typing import Optional
 
 
+class ProxyDataStream:
+    """
+    A long-lived do_put stream, carrying the data batches of one channel which
+    share the same schema. The command (header) of each batch travels in its app
+    metadata, and the server acks each batch once it is handled, with the sender
+    credits. The acks are read on a separate thread, so that batches can be
+    written back-to-back without waiting for a round-trip each.
+    """
+
+    def __init__(self, client: FlightClient, command: bytes, schema: Schema):
+        self.schema = schema
+        self._writer, self._reader = client.do_put(
+            FlightDescriptor.for_command(command), schema
+        )
+        self._writer: FlightStreamWriter
+        self._reader: FlightMetadataReader
+        self._condition = threading.Condition()
+        self._num_unacked = 0
+        self._error: Optional[BaseException] = None
+        self.credit = 0
+        self._ack_reader = threading.Thread(
+            target=self._read_acks, name="ProxyDataStream-acks", daemon=True
+        )
+        self._ack_reader.start()
+
+    def write(self, command: bytes, table: Table) -> None:
+        """
+        Write a data batch to the stream, without waiting for its ack.
+        :param command: a command to pass along with the batch.
+        :param table: a PyArrow.Table of the schema of the stream.
+        """
+        with self._condition:
+            self._raise_if_failed()
+            self._num_unacked += 1
+        self._writer.write_with_metadata(_to_record_batch(table), py_buffer(command))
+
+    def flush(self) -> int:
+        """
+        Wait until all the batches written so far are acked by the server.
+        :return: an integer representing the latest credit value received.
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self._num_unacked == 0 or self._error is not None
+            )
+            self._raise_if_failed()
+            return self.credit
+
+    def close(self) -> None:
+        """
+        Wait for the acks of all the batches, then close the stream.
+        """
+        try:
+            self.flush()
+        finally:
+            self._writer.done_writing()
+            self._ack_reader.join()
+            self._writer.close()
+
+    def _read_acks(self) -> None:
+        try:
+            while True:
+                credit_buf: Buffer = self._reader.read()
+                if credit_buf is None:
+                    break
+                with self._condition:
+                    self.credit = int.from_bytes(
+                        credit_buf.to_pybytes(), byteorder="little"
+                    )
+                    self._num_unacked -= 1
+                    self._condition.notify_all()
+        except BaseException as err:
+            with self._condition:
+                self._error = err
+                self._condition.notify_all()
+        finally:
+            with self._condition:
+                if self._num_unacked > 0 and self._error is None:
+                    self._error = ConnectionError("data stream closed before ack")
+                self._condition.notify_all()
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+
+def _to_record_batch(table: Table) -> RecordBatch:
+    """
+    Combine a table into one record batch, so that it is sent as one message.
+    """
+    batches = table.combine_chunks().to_batches()
+    if len(batches) == 1:
+        return batches[0]
+    return RecordBatch.from_pylist([], schema=table.schema)
+
+
 class ProxyClient(FlightClient):
     def __init__(
         self,
@@ -100,6 +198,15 @@ class ProxyClient(FlightClient):
             )
         return credit_count
 
+    def open_data_stream(self, command: bytes, schema: Schema) -> ProxyDataStream:
+        """
+        Open a long-lived stream to send data batches of the same schema.
+        :param command: a command in the descriptor of the stream.
+        :param schema: the schema of all the batches to be sent.
+        :return: the ProxyDataStream.
+        """
+        return ProxyDataStream(self, command, schema)
+
     def _handshake(self, handshake_port: int) -> None:
         """
         Send the handshake port to Java Proxy Server, which will be forwarded to
@@ -187,23 +187,51 @@ class ProxyServer(FlightServerBase):
         `self.process_data()` handler.  Also send back number of sender batches
         currently in internal queue for credit calculations
 
+        A stream carrying app metadata with its batches is a long-lived stream of
+        messages: each batch is handled on its own, with the app metadata as its
+        command, and acked with the credits. Otherwise, the whole stream is one
+        message, with the command of the descriptor.
+
         :param context: server context, containing information of middlewares.
         :param descriptor: the descriptor of this batch of data.
         :param reader: the input stream of batches of records.
         :param writer: the output stream.
         :return:
         """
+        batches = []
+        streamed = False
+        while True:
+            try:
+                chunk = reader.read_chunk()
+            except StopIteration:
+                break
+            if chunk.app_metadata is None:
+                batches.append(chunk.data)
+                continue
+            streamed = True
+            sender_credits = self.process_data(
+                chunk.app_metadata.to_pybytes(), Table.from_batches([chunk.data])
+            )
+            self._write_credits(
+                writer, sender_credits if isinstance(sender_credits, int) else 0
+            )
 
-        data: Table = reader.read_all()
+        if streamed:
+            return
+        data: Table = Table.from_batches(batches, schema=reader.schema)
         command: bytes = descriptor.command
         logger.debug(f"getting a data batch {data}")
 
         sender_credits = self.process_data(command, data)
         if isinstance(sender_credits, int):
-            sender_credits_buf: Buffer = py_buffer(
-                sender_credits.to_bytes(length=8, byteorder="little")
-            )
-            writer.write(sender_credits_buf)
+            self._write_credits(writer, sender_credits)
+
+    @staticmethod
+    def _write_credits(writer: FlightMetadataWriter, sender_credits: int) -> None:
+        sender_credits_buf: Buffer = py_buffer(
+            sender_credits.to_bytes(length=8, byteorder="little")
+        )
+        writer.write(sender_credits_buf)
 
     ###############################
     # Actions related methods #
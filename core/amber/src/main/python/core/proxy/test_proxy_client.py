@@ -154,3 +154,34 @@ class TestProxyClient:
         assert data_queue.qsize() == 4
         for i, row in data_table.to_pandas().iterrows():
             assert data_queue.get().equals(row)
+
+    def test_client_can_stream_data_batches(self, server, data_table):
+        received = []
+
+        def handler(command, table):
+            received.append((command, table.num_rows))
+            return len(received)
+
+        server.register_data_handler(handler)
+        client = ProxyClient()
+        stream = client.open_data_stream(b"header", data_table.schema)
+        for i in range(3):
+            stream.write(f"batch-{i}".encode(), data_table.slice(0, i + 1))
+        assert stream.flush() == 3
+        stream.write(b"batch-3", data_table)
+        stream.close()
+
+        assert received == [
+            (b"batch-0", 1),
+            (b"batch-1", 2),
+            (b"batch-2", 3),
+            (b"batch-3", 4),
+        ]
+        assert stream.credit == 4
+
+    def test_data_stream_raises_errors_of_server(self, server, data_table):
+        client = ProxyClient()
+        stream = client.open_data_stream(b"header", data_table.schema)
+        stream.write(b"batch", data_table)
+        with pytest.raises(ArrowNotImplementedError):
+            stream.close()
@@ -20,10 +20,11 @@ import sys
 import traceback
 from threading import Event
 
+import pyarrow
 from loguru import logger
 from typing import Iterator, Optional
 from core.architecture.managers import Context
-from core.models import ExceptionInfo, State, TupleLike
+from core.models import ArrowBatchOperator, ExceptionInfo, State, TupleLike
 from core.models.internal_marker import StartOfInputPort, EndOfInputPort
 from core.models.marker import Marker
 from core.models.table import all_output_to_tuple
@@ -41,28 +42,58 @@ class DataProcessor(Runnable, Stoppable):
     def __init__(self, context: Context):
         self._running = Event()
         self._context = context
+        self._steps: Iterator[None] = self._process()
 
     def run(self) -> None:
         """
-        Start the data processing loop. Wait for context switch conditions to be met,
-        then continuously process markers or tuples until stopped.
+        Drive the data processing loop on a dedicated thread, switching context with
+        the MainLoop thread at every step.
+
+        The thread is started by the MainLoop while it holds the context switch
+        condition, right before it waits for the next step. The steps may have
+        already been partially driven by the MainLoop in the cooperative mode.
         """
         with self._context.tuple_processing_manager.context_switch_condition:
-            self._context.tuple_processing_manager.context_switch_condition.wait()
+            # wait till the MainLoop starts waiting.
+            pass
+        self._post_switch_context_checks()
+        for _ in self._steps:
+            self._switch_context()
+
+    def step(self) -> None:
+        """
+        Drive the data processing loop till its next context switch on the calling
+        thread. Used by the MainLoop in the cooperative mode.
+        """
+        next(self._steps, None)
+
+    def _process(self) -> Iterator[None]:
+        """
+        Continuously process markers or tuples until stopped, yielding every time
+        the control should be switched back to the MainLoop.
+        """
         self._running.set()
-        self._switch_context()
+        yield
         while self._running.is_set():
             marker = self._context.marker_processing_manager.get_input_marker()
+            tuple_slice = (
+                self._context.tuple_processing_manager.current_input_tuple_slice
+            )
+            batch = self._context.tuple_processing_manager.current_input_batch
             tuple_ = self._context.tuple_processing_manager.current_input_tuple
             if marker is not None:
-                self.process_marker(marker)
+                yield from self.process_marker(marker)
+            elif batch is not None:
+                yield from self.process_arrow_batch()
+            elif tuple_slice is not None:
+                yield from self.process_tuple_slice()
             elif tuple_ is not None:
-                self.process_tuple()
+                yield from self.process_tuple()
             else:
                 raise RuntimeError("No marker or tuple to process.")
-            self._switch_context()
+            yield
 
-    def process_marker(self, marker: Marker) -> None:
+    def process_marker(self, marker: Marker) -> Iterator[None]:
         """
         Process an input marker by invoking appropriate state
         or tuple generation based on the marker type.
@@ -80,8 +111,11 @@ class DataProcessor(Runnable, Stoppable):
                     self._set_output_state(executor.process_state(marker, port_id))
                 elif isinstance(marker, EndOfInputPort):
                     self._set_output_state(executor.produce_state_on_finish(port_id))
-                    self._switch_context()
-                    self._set_output_tuple(executor.on_finish(port_id))
+                    yield
+                    if isinstance(executor, ArrowBatchOperator):
+                        yield from self._set_output_batch(executor.on_finish(port_id))
+                    else:
+                        yield from self._set_output_tuple(executor.on_finish(port_id))
 
         except Exception as err:
             logger.exception(err)
@@ -90,9 +124,9 @@ class DataProcessor(Runnable, Stoppable):
             self._report_exception(exc_info)
 
         finally:
-            self._switch_context()
+            yield
 
-    def process_tuple(self) -> None:
+    def process_tuple(self) -> Iterator[None]:
         """
         Process an input tuple by invoking the executor's tuple processing method.
         """
@@ -106,7 +140,9 @@ class DataProcessor(Runnable, Stoppable):
                     self._context.worker_id,
                     self._context.console_message_manager.print_buf,
                 ):
-                    self._set_output_tuple(executor.process_tuple(tuple_, port_id))
+                    yield from self._set_output_tuple(
+                        executor.process_tuple(tuple_, port_id)
+                    )
 
             except Exception as err:
                 logger.exception(err)
@@ -115,12 +151,93 @@ class DataProcessor(Runnable, Stoppable):
                 self._report_exception(exc_info)
 
             finally:
-                self._switch_context()
+                yield
+
+    def process_arrow_batch(self) -> Iterator[None]:
+        """
+        Process an input batch, as a pyarrow.Table, by invoking the executor's batch
+        processing method. If the executor raises, the rest of the batch is dropped.
+        """
+        finished_current = self._context.tuple_processing_manager.finished_current
+        while not finished_current.is_set():
+            try:
+                executor = self._context.executor_manager.executor
+                port_id = self._context.tuple_processing_manager.get_input_port_id()
+                batch = self._context.tuple_processing_manager.get_input_batch()
+                with replace_print(
+                    self._context.worker_id,
+                    self._context.console_message_manager.print_buf,
+                ):
+                    yield from self._set_output_batch(
+                        executor.process_arrow_batch(batch, port_id)
+                    )
+
+            except Exception as err:
+                logger.exception(err)
+                exc_info = sys.exc_info()
+                self._context.exception_manager.set_exception_info(exc_info)
+                self._report_exception(exc_info)
+                finished_current.set()
+
+            finally:
+                yield
+
+    def process_tuple_slice(self) -> Iterator[None]:
+        """
+        Process a slice of input tuples, handed over by the MainLoop in one context
+        switch. The output tuples are buffered and handed back together.
 
-    def _set_output_tuple(self, output_iterator: Iterator[Optional[TupleLike]]) -> None:
+        If the executor raises on a tuple, the rest of the slice is handed back as
+        unprocessed, so that the MainLoop can process them after the exception is
+        handled.
+        """
+        tuple_processing_manager = self._context.tuple_processing_manager
+        finished_current = tuple_processing_manager.finished_current
+        while not finished_current.is_set():
+            tuple_slice = tuple_processing_manager.get_input_tuple_slice()
+            processed = 0
+            try:
+                executor = self._context.executor_manager.executor
+                port_id = tuple_processing_manager.get_input_port_id()
+                with replace_print(
+                    self._context.worker_id,
+                    self._context.console_message_manager.print_buf,
+                ):
+                    for tuple_ in tuple_slice:
+                        tuple_processing_manager.current_input_tuple = tuple_
+                        yield from self._buffer_output_tuples(
+                            executor.process_tuple(tuple_, port_id)
+                        )
+                        processed += 1
+                tuple_processing_manager.current_input_tuple = None
+
+            except Exception as err:
+                logger.exception(err)
+                tuple_processing_manager.unprocessed_input_tuples = tuple_slice[
+                    processed + 1 :
+                ]
+                exc_info = sys.exc_info()
+                self._context.exception_manager.set_exception_info(exc_info)
+                self._report_exception(exc_info)
+
+            finally:
+                finished_current.set()
+                yield
+
+    def _set_output_tuple(
+        self, output_iterator: Iterator[Optional[TupleLike]]
+    ) -> Iterator[None]:
         """
         Set the output tuple after processing by the executor.
         """
+        if self._context.tuple_processing_manager.is_slicing_enabled():
+            # let the MainLoop start waiting for the outputs before handing
+            # them back.
+            yield
+            yield from self._buffer_output_tuples(output_iterator)
+            self._context.tuple_processing_manager.finished_current.set()
+            return
+
         for output in output_iterator:
             # output could be a None, a TupleLike, or a TableLike.
             for output_tuple in all_output_to_tuple(output):
@@ -128,13 +245,80 @@ class DataProcessor(Runnable, Stoppable):
                     output_tuple.finalize(
                         self._context.output_manager.get_port().get_schema()
                     )
-                self._switch_context()
+                yield
                 self._context.tuple_processing_manager.current_output_tuple = (
                     output_tuple
                 )
-                self._switch_context()
+                yield
         self._context.tuple_processing_manager.finished_current.set()
 
+    def _buffer_output_tuples(
+        self, output_iterator: Iterator[Optional[TupleLike]]
+    ) -> Iterator[None]:
+        """
+        Buffer the output tuples after processing by the executor. The buffer is
+        handed back to the MainLoop once it reaches the configured limit, or
+        together with the rest of the slice.
+        """
+        tuple_processing_manager = self._context.tuple_processing_manager
+        for output in output_iterator:
+            # output could be a None, a TupleLike, or a TableLike.
+            for output_tuple in all_output_to_tuple(output):
+                if output_tuple is None:
+                    continue
+                output_tuple.finalize(
+                    self._context.output_manager.get_port().get_schema()
+                )
+                tuple_processing_manager.current_output_tuples.append(output_tuple)
+                if (
+                    len(tuple_processing_manager.current_output_tuples)
+                    >= tuple_processing_manager.max_buffered_outputs
+                ):
+                    yield
+
+    def _set_output_batch(
+        self, output_iterator: Iterator[Optional[pyarrow.Table]]
+    ) -> Iterator[None]:
+        """
+        Set the output batch after processing by the executor. Each batch is
+        conformed to the output schema, and handed back without per-row conversion.
+        """
+        schema = None
+        for output_batch in output_iterator:
+            if output_batch is not None:
+                if schema is None:
+                    schema = self._context.output_manager.get_port().get_schema()
+                output_batch = self._conform_batch_to_schema(output_batch, schema)
+            yield
+            self._context.tuple_processing_manager.current_output_batch = output_batch
+            yield
+        self._context.tuple_processing_manager.finished_current.set()
+
+    @staticmethod
+    def _conform_batch_to_schema(batch, schema) -> pyarrow.Table:
+        """
+        Select and cast the columns of an output batch to match the given schema.
+
+        :param batch: a pyarrow.Table or a pyarrow.RecordBatch.
+        :param schema: the Schema of the output port.
+        :return: a pyarrow.Table in the exact arrow schema of the output port.
+        """
+        if isinstance(batch, pyarrow.RecordBatch):
+            batch = pyarrow.Table.from_batches([batch])
+        if not isinstance(batch, pyarrow.Table):
+            raise TypeError(
+                f"ArrowBatchOperator can only output pyarrow.Table, got {type(batch)}."
+            )
+        names = schema.get_attr_names()
+        missing = set(names) - set(batch.column_names)
+        unexpected = set(batch.column_names) - set(names)
+        if missing or unexpected:
+            raise KeyError(
+                f"Output batch columns {batch.column_names} do not match the output "
+                f"schema {names}."
+            )
+        return batch.select(names).cast(schema.as_arrow_schema())
+
     def _set_output_state(self, output_state: State) -> None:
         """
         Set the output state after processing by the executor.
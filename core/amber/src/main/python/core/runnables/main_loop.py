@@ -15,20 +15,25 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import itertools
 import threading
 import time
 import typing
+
+import pyarrow
 from loguru import logger
 from overrides import overrides
 from pampy import match
-from typing import Iterator, Optional
+from typing import Iterator, List, Optional
 
 from core.architecture.managers.context import Context
+from core.architecture.managers.executor_manager import ExecutionMode
 from core.architecture.managers.pause_manager import PauseType
 from core.architecture.packaging.input_manager import EndOfOutputPorts
 from core.architecture.rpc.async_rpc_client import AsyncRPCClient
 from core.architecture.rpc.async_rpc_server import AsyncRPCServer
 from core.models import (
+    ArrowBatchOperator,
     InternalQueue,
     Tuple,
 )
@@ -86,9 +91,7 @@ class MainLoop(StoppableQueueBlockingRunnable):
         self._async_rpc_client = AsyncRPCClient(output_queue, context=self.context)
 
         self.data_processor = DataProcessor(self.context)
-        threading.Thread(
-            target=self.data_processor.run, daemon=True, name="data_processor_thread"
-        ).start()
+        self._data_processor_thread: Optional[threading.Thread] = None
 
     def complete(self) -> None:
         """
@@ -183,32 +186,60 @@ class MainLoop(StoppableQueueBlockingRunnable):
         This is being invoked for each Tuple/Marker that are unpacked from the
         DataElement.
         """
-        if isinstance(self.context.tuple_processing_manager.current_input_tuple, Tuple):
+        self._record_input_statistics()
+        for output in self.process_tuple_with_udf():
+            self._check_and_process_control()
+            if isinstance(output, pyarrow.Table):
+                self._send_output_batch(output)
+            elif output is not None:
+                self._send_output_tuple(output)
+
+    def _record_input_statistics(self) -> None:
+        tuple_processing_manager = self.context.tuple_processing_manager
+        port_id = tuple_processing_manager.current_input_port_id
+        if isinstance(tuple_processing_manager.current_input_tuple, Tuple):
+            self.context.statistics_manager.increase_input_tuple_statistics(
+                port_id, (tuple_processing_manager.current_input_tuple,)
+            )
+        elif tuple_processing_manager.current_input_tuple_slice:
+            self.context.statistics_manager.increase_input_tuple_statistics(
+                port_id, tuple_processing_manager.current_input_tuple_slice
+            )
+        elif tuple_processing_manager.current_input_batch is not None:
+            batch = tuple_processing_manager.current_input_batch
             self.context.statistics_manager.increase_input_statistics(
-                self.context.tuple_processing_manager.current_input_port_id,
-                self.context.tuple_processing_manager.current_input_tuple.in_mem_size(),
+                port_id, batch.nbytes, count=batch.num_rows
             )
 
-        for output_tuple in self.process_tuple_with_udf():
-            self._check_and_process_control()
-            if output_tuple is not None:
-                self.context.statistics_manager.increase_output_statistics(
-                    PortIdentity(0), output_tuple.in_mem_size()
+    def _send_output_tuple(self, output_tuple: Tuple) -> None:
+        self.context.statistics_manager.increase_output_tuple_statistics(
+            PortIdentity(0), (output_tuple,)
+        )
+        for to, batch in self.context.output_manager.tuple_to_batch(output_tuple):
+            self._output_queue.put(
+                DataElement(
+                    tag=ChannelIdentity(
+                        ActorVirtualIdentity(self.context.worker_id), to, False
+                    ),
+                    payload=batch,
                 )
-                for to, batch in self.context.output_manager.tuple_to_batch(
-                    output_tuple
-                ):
-                    self._output_queue.put(
-                        DataElement(
-                            tag=ChannelIdentity(
-                                ActorVirtualIdentity(self.context.worker_id), to, False
-                            ),
-                            payload=batch,
-                        )
-                    )
-                self.context.output_manager.save_tuple_to_storage_if_needed(
-                    output_tuple
+            )
+        self.context.output_manager.save_tuple_to_storage_if_needed(output_tuple)
+
+    def _send_output_batch(self, output_batch: pyarrow.Table) -> None:
+        self.context.statistics_manager.increase_output_statistics(
+            PortIdentity(0), output_batch.nbytes, count=output_batch.num_rows
+        )
+        for to, batch in self.context.output_manager.arrow_table_to_batch(output_batch):
+            self._output_queue.put(
+                DataElement(
+                    tag=ChannelIdentity(
+                        ActorVirtualIdentity(self.context.worker_id), to, False
+                    ),
+                    payload=batch,
                 )
+            )
+        self.context.output_manager.save_arrow_table_to_storage_if_needed(output_batch)
 
     def process_input_state(self) -> None:
         self._switch_context()
@@ -225,21 +256,48 @@ class MainLoop(StoppableQueueBlockingRunnable):
                     )
                 )
 
-    def process_tuple_with_udf(self) -> Iterator[Optional[Tuple]]:
+    def process_tuple_with_udf(
+        self,
+    ) -> Iterator[Optional[typing.Union[Tuple, pyarrow.Table]]]:
         """
         Process the Tuple/InputExhausted with the current link.
 
         This is a wrapper to invoke processing of the executor.
 
-        :return: Iterator[Tuple], iterator of result Tuple(s).
+        :return: Iterator[Union[Tuple, pyarrow.Table]], iterator of result Tuple(s),
+            or result batches of an ArrowBatchOperator.
         """
-        finished_current = self.context.tuple_processing_manager.finished_current
+        tuple_processing_manager = self.context.tuple_processing_manager
+        finished_current = tuple_processing_manager.finished_current
         finished_current.clear()
 
         while not finished_current.is_set():
             self._check_and_process_control()
             self._switch_context()
-            yield self.context.tuple_processing_manager.get_output_tuple()
+            if self._is_arrow_batch_executor():
+                yield tuple_processing_manager.get_output_batch()
+            elif tuple_processing_manager.is_slicing_enabled():
+                self._reschedule_unprocessed_input_tuples()
+                yield from tuple_processing_manager.get_output_tuples()
+            else:
+                yield tuple_processing_manager.get_output_tuple()
+
+    def _reschedule_unprocessed_input_tuples(self) -> None:
+        """
+        Chain the input tuples left unprocessed by the DataProcessor (e.g., due to
+        an exception in the middle of a slice) back on top of the current iterator,
+        so that they will be processed once the worker resumes.
+        """
+        unprocessed = (
+            self.context.tuple_processing_manager.get_unprocessed_input_tuples()
+        )
+        if unprocessed:
+            self.context.tuple_processing_manager.current_input_tuple_iter = (
+                itertools.chain(
+                    unprocessed,
+                    self.context.tuple_processing_manager.current_input_tuple_iter,
+                )
+            )
 
     def _process_control_element(self, control_element: ControlElement) -> None:
         """
@@ -254,6 +312,47 @@ class MainLoop(StoppableQueueBlockingRunnable):
         self.process_input_tuple()
         self._check_and_process_control()
 
+    def _process_arrow_batch(self, batch: pyarrow.Table) -> None:
+        self.context.tuple_processing_manager.current_input_batch = batch
+        self.process_input_tuple()
+        self._check_and_process_control()
+
+    def _is_arrow_batch_executor(self) -> bool:
+        return isinstance(self.context.executor_manager.executor, ArrowBatchOperator)
+
+    def _process_tuple_slice(self, tuple_slice: List[Tuple]) -> None:
+        self.context.tuple_processing_manager.current_input_tuple_slice = tuple_slice
+        self.process_input_tuple()
+        self._check_and_process_control()
+        # the failed tuple of the slice, if any, is kept until the exception
+        # is handled, so that it can be retried.
+        self.context.tuple_processing_manager.current_input_tuple = None
+
+    def _take_tuple_slice(self, first: Tuple) -> List[Tuple]:
+        """
+        Take the next slice of consecutive Tuples from the current input iterator,
+        starting with the given Tuple. A slice ends at the configured slice size,
+        at the end of the DataFrame payload, or before the next non-Tuple element,
+        which is put back to be processed next.
+
+        :param first: the first Tuple of the slice.
+        :return: a list of Tuples to be handed to the DataProcessor at once.
+        """
+        tuple_processing_manager = self.context.tuple_processing_manager
+        slice_size = tuple_processing_manager.input_slice_size
+        tuple_slice = [first]
+        while slice_size <= 0 or len(tuple_slice) < slice_size:
+            element = next(tuple_processing_manager.current_input_tuple_iter, None)
+            if element is None:
+                break
+            if not isinstance(element, Tuple):
+                tuple_processing_manager.current_input_tuple_iter = itertools.chain(
+                    [element], tuple_processing_manager.current_input_tuple_iter
+                )
+                break
+            tuple_slice.append(element)
+        return tuple_slice
+
     def _process_state(self, state_: State) -> None:
         self.context.marker_processing_manager.current_input_marker = state_
         self.process_input_state()
@@ -414,7 +513,9 @@ class MainLoop(StoppableQueueBlockingRunnable):
 
         self.context.tuple_processing_manager.current_input_tuple_iter = (
             self.context.input_manager.process_data_payload(
-                data_element.tag, data_element.payload
+                data_element.tag,
+                data_element.payload,
+                as_arrow_table=self._is_arrow_batch_executor(),
             )
         )
 
@@ -430,10 +531,18 @@ class MainLoop(StoppableQueueBlockingRunnable):
             )
         ) is not None:
             try:
+                if (
+                    isinstance(element, Tuple)
+                    and self.context.tuple_processing_manager.is_slicing_enabled()
+                ):
+                    self._process_tuple_slice(self._take_tuple_slice(element))
+                    continue
                 match(
                     element,
                     Tuple,
                     self._process_tuple,
+                    pyarrow.Table,
+                    self._process_arrow_batch,
                     StartOfInputPort,
                     self._process_start_of_input_port,
                     EndOfInputPort,
@@ -469,12 +578,17 @@ class MainLoop(StoppableQueueBlockingRunnable):
 
     def _switch_context(self) -> None:
         """
-        Notify the DataProcessor thread and wait here until being switched back.
+        Notify the DataProcessor thread and wait here until being switched back. In
+        the cooperative mode, run the DataProcessor inline till its next switch.
         """
         start_time = time.time_ns()
-        with self.context.tuple_processing_manager.context_switch_condition:
-            self.context.tuple_processing_manager.context_switch_condition.notify()
-            self.context.tuple_processing_manager.context_switch_condition.wait()
+        if self.context.executor_manager.execution_mode == ExecutionMode.COOPERATIVE:
+            self.data_processor.step()
+        else:
+            with self.context.tuple_processing_manager.context_switch_condition:
+                self._start_data_processor_thread()
+                self.context.tuple_processing_manager.context_switch_condition.notify()
+                self.context.tuple_processing_manager.context_switch_condition.wait()
         self._post_switch_context_checks()
         end_time = time.time_ns()
         self.context.statistics_manager.increase_data_processing_time(
@@ -482,6 +596,20 @@ class MainLoop(StoppableQueueBlockingRunnable):
         )
         self.context.statistics_manager.update_total_execution_time(end_time)
 
+    def _start_data_processor_thread(self) -> None:
+        """
+        Start the DataProcessor thread if it is not started yet. It has to be
+        invoked while holding the context switch condition, so that the thread
+        only proceeds after the MainLoop starts waiting.
+        """
+        if self._data_processor_thread is None:
+            self._data_processor_thread = threading.Thread(
+                target=self.data_processor.run,
+                daemon=True,
+                name="data_processor_thread",
+            )
+            self._data_processor_thread.start()
+
     def _check_and_report_debug_event(self) -> None:
         if self.context.debug_manager.has_debug_event():
             debug_event = self.context.debug_manager.get_debug_event()
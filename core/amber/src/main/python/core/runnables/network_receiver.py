@@ -113,7 +113,7 @@ class NetworkReceiver(Runnable, Stoppable):
                 )
             else:
                 shared_queue.put(DataElement(tag=data_header.tag, payload=payload))
-            return shared_queue.in_mem_size()
+            return shared_queue.get_sender_credit()
 
         self._proxy_server.register_data_handler(data_handler)
 
@@ -132,7 +132,7 @@ class NetworkReceiver(Runnable, Stoppable):
                     payload=python_control_message.payload,
                 )
             )
-            return shared_queue.in_mem_size()
+            return shared_queue.get_sender_credit()
 
         self._proxy_server.register_control_handler(control_handler)
 
@@ -147,7 +147,7 @@ class NetworkReceiver(Runnable, Stoppable):
             python_actor_message = PythonActorMessage().parse(message)
             command = get_one_of(python_actor_message.payload)
             self.look_up(command)(command, shared_queue)
-            return shared_queue.in_mem_size()
+            return shared_queue.get_sender_credit()
 
         self._proxy_server.register_actor_message_handler(actor_message_handler)
 
@@ -15,12 +15,13 @@
 # specific language governing permissions and limitations
 # under the License.
 
-from typing import Optional
+from typing import Dict, Optional
 
 from loguru import logger
 from overrides import overrides
 import pyarrow as pa
 from core.models import DataPayload, InternalQueue, DataFrame, MarkerFrame, State
+from core.models.marker import EndOfInputChannel
 
 from core.models.internal_queue import (
     InternalQueueElement,
@@ -29,6 +30,7 @@ from core.models.internal_queue import (
     ChannelMarkerElement,
 )
 from core.proxy import ProxyClient
+from core.proxy.proxy_client import ProxyDataStream
 from core.util import StoppableQueueBlockingRunnable
 from proto.edu.uci.ics.amber.engine.architecture.rpc import ChannelMarkerPayload
 from proto.edu.uci.ics.amber.engine.common import (
@@ -42,6 +44,12 @@ from proto.edu.uci.ics.amber.core import ChannelIdentity
 class NetworkSender(StoppableQueueBlockingRunnable):
     """
     Serialize and send messages.
+
+    Data batches are sent through a long-lived stream per channel, one after
+    another without waiting for their acks. A stream is replaced when the schema
+    of the batches changes (e.g., for a marker), and closed at the end of its
+    channel. All the streams are flushed before a control message is sent, so
+    that the control message is handled after the data sent before it.
     """
 
     def __init__(
@@ -55,6 +63,7 @@ class NetworkSender(StoppableQueueBlockingRunnable):
         self._proxy_client = ProxyClient(
             host=host, port=port, handshake_port=handshake_port
         )
+        self._data_streams: Dict[ChannelIdentity, ProxyDataStream] = dict()
 
     @overrides(check_signature=False)
     def receive(self, next_entry: InternalQueueElement):
@@ -67,6 +76,46 @@ class NetworkSender(StoppableQueueBlockingRunnable):
         else:
             raise TypeError(f"Unexpected entry {next_entry}")
 
+    @logger.catch(reraise=True)
+    @overrides
+    def post_stop(self) -> None:
+        for stream in self._data_streams.values():
+            stream.close()
+        self._data_streams.clear()
+
+    def _send_table(
+        self, to: ChannelIdentity, data_header: PythonDataHeader, table: pa.Table
+    ) -> None:
+        """
+        Send a table through the data stream of the channel, opening a new stream
+        if there is none of the same schema.
+
+        :param to: The target ChannelIdentity
+        :param data_header: The header of the table.
+        :param table: The table to be sent.
+        """
+        command = bytes(data_header)
+        stream = self._data_streams.get(to)
+        if stream is not None and not stream.schema.equals(
+            table.schema, check_metadata=True
+        ):
+            del self._data_streams[to]
+            stream.close()
+            stream = None
+        if stream is None:
+            stream = self._proxy_client.open_data_stream(command, table.schema)
+            self._data_streams[to] = stream
+        stream.write(command, table)
+
+    def _close_data_stream(self, to: ChannelIdentity) -> None:
+        stream = self._data_streams.pop(to, None)
+        if stream is not None:
+            stream.close()
+
+    def _flush_data_streams(self) -> None:
+        for stream in self._data_streams.values():
+            stream.flush()
+
     @logger.catch(reraise=True)
     def _send_channel_marker(
         self, to: ChannelIdentity, data_payload: ChannelMarkerPayload
@@ -85,7 +134,7 @@ class NetworkSender(StoppableQueueBlockingRunnable):
         schema = pa.schema([("payload", pa.binary())])
         data = [pa.array([bytes(data_payload)])]
         table = pa.Table.from_arrays(data, schema=schema)
-        self._proxy_client.send_data(bytes(data_header), table)
+        self._send_table(to, data_header, table)
 
     @logger.catch(reraise=True)
     def _send_data(self, to: ChannelIdentity, data_payload: DataPayload) -> None:
@@ -100,7 +149,7 @@ class NetworkSender(StoppableQueueBlockingRunnable):
 
         if isinstance(data_payload, DataFrame):
             data_header = PythonDataHeader(tag=to, payload_type="Data")
-            self._proxy_client.send_data(bytes(data_header), data_payload.frame)
+            self._send_table(to, data_header, data_payload.frame)
         elif isinstance(data_payload, MarkerFrame):
             data_header = PythonDataHeader(
                 tag=to, payload_type=data_payload.frame.__class__.__name__
@@ -108,9 +157,11 @@ class NetworkSender(StoppableQueueBlockingRunnable):
             table = (
                 data_payload.frame.to_table()
                 if isinstance(data_payload.frame, State)
-                else None
+                else pa.Table.from_arrays([])
             )
-            self._proxy_client.send_data(bytes(data_header), table)
+            self._send_table(to, data_header, table)
+            if isinstance(data_payload.frame, EndOfInputChannel):
+                self._close_data_stream(to)
         else:
             raise TypeError(f"Unexpected payload {data_payload}")
 
@@ -126,6 +177,7 @@ class NetworkSender(StoppableQueueBlockingRunnable):
         :param control_payload: The control payload to be sent, can be either
             ControlInvocation or ReturnInvocation.
         """
+        self._flush_data_streams()
         python_control_message = PythonControlMessage(tag=to, payload=control_payload)
         int.from_bytes(
             self._proxy_client.call_action("control", bytes(python_control_message)),
@@ -23,6 +23,8 @@ import pandas
 import pyarrow
 import pytest
 
+from core.architecture.managers.executor_manager import ExecutionMode
+from core.architecture.worker_config import WorkerConfig
 from core.models import (
     DataFrame,
     MarkerFrame,
@@ -74,6 +76,7 @@ from proto.edu.uci.ics.amber.engine.architecture.worker import (
 )
 from proto.edu.uci.ics.amber.engine.common import ControlPayloadV2
 from pytexera.udf.examples.count_batch_operator import CountBatchOperator
+from pytexera.udf.examples.echo_arrow_batch_operator import EchoArrowBatchOperator
 from pytexera.udf.examples.echo_operator import EchoOperator
 
 
@@ -186,6 +189,17 @@ class TestMainLoop:
 
         return data_elements
 
+    @pytest.fixture
+    def mock_multi_row_data_element(self, mock_batch, mock_data_input_channel):
+        return DataElement(
+            tag=mock_data_input_channel,
+            payload=DataFrame(
+                frame=pyarrow.Table.from_pandas(
+                    pandas.DataFrame([tuple_.as_dict() for tuple_ in mock_batch])
+                )
+            ),
+        )
+
     @pytest.fixture
     def mock_end_of_upstream(self, mock_tuple, mock_data_input_channel):
         return DataElement(
@@ -376,6 +390,38 @@ class TestMainLoop:
         )
         return ControlElement(tag=mock_control_input_channel, payload=payload)
 
+    @pytest.fixture
+    def mock_initialize_arrow_batch_executor(
+        self,
+        mock_control_input_channel,
+        mock_sender_actor,
+        mock_link,
+        command_sequence,
+        mock_raw_schema,
+    ):
+
+        operator_code = "from pytexera import *\n" + inspect.getsource(
+            EchoArrowBatchOperator
+        )
+        command = set_one_of(
+            ControlRequest,
+            InitializeExecutorRequest(
+                op_exec_init_info=set_one_of(
+                    OpExecInitInfo, OpExecWithCode(operator_code, "python")
+                ),
+                is_source=False,
+            ),
+        )
+        payload = set_one_of(
+            ControlPayloadV2,
+            ControlInvocation(
+                method_name="InitializeExecutor",
+                command_id=command_sequence,
+                command=command,
+            ),
+        )
+        return ControlElement(tag=mock_control_input_channel, payload=payload)
+
     @pytest.fixture
     def mock_add_partitioning(
         self,
@@ -1167,3 +1213,220 @@ class TestMainLoop:
             == ControlReturn(empty_return=EmptyReturn())
         )
         reraise()
+
+    @pytest.mark.timeout(5)
+    @pytest.mark.parametrize("slice_size", [0, 10])
+    def test_main_loop_thread_can_process_data_frame_in_slices(
+        self,
+        slice_size,
+        mock_data_output_channel,
+        mock_control_output_channel,
+        input_queue,
+        output_queue,
+        mock_batch,
+        mock_multi_row_data_element,
+        main_loop,
+        main_loop_thread,
+        mock_assign_input_port,
+        mock_assign_output_port,
+        mock_add_input_channel,
+        mock_add_partitioning,
+        mock_initialize_executor,
+        mock_end_of_upstream,
+        command_sequence,
+        reraise,
+    ):
+        main_loop.context.tuple_processing_manager.input_slice_size = slice_size
+        main_loop_thread.start()
+
+        for control_element in [
+            mock_assign_input_port,
+            mock_assign_output_port,
+            mock_add_input_channel,
+            mock_add_partitioning,
+            mock_initialize_executor,
+        ]:
+            input_queue.put(control_element)
+            assert output_queue.get() == ControlElement(
+                tag=mock_control_output_channel,
+                payload=ControlPayloadV2(
+                    return_invocation=ReturnInvocation(
+                        command_id=command_sequence,
+                        return_value=ControlReturn(empty_return=EmptyReturn()),
+                    )
+                ),
+            )
+
+        # all 57 rows of the DataFrame are processed, in their original order.
+        input_queue.put(mock_multi_row_data_element)
+        for expected_tuple in mock_batch:
+            output_data_element: DataElement = output_queue.get()
+            assert output_data_element.tag == mock_data_output_channel
+            assert isinstance(output_data_element.payload, DataFrame)
+            data_frame: DataFrame = output_data_element.payload
+            assert len(data_frame.frame) == 1
+            assert Tuple(data_frame.frame.to_pylist()[0]) == expected_tuple
+
+        # markers after the slices are still processed, till the worker completes.
+        input_queue.put(mock_end_of_upstream)
+        completed_methods = []
+        while "WorkerExecutionCompleted" not in completed_methods:
+            elem = output_queue.get()
+            if isinstance(elem, ControlElement):
+                completed_methods.append(elem.payload.control_invocation.method_name)
+        assert completed_methods[0] == "PortCompleted"
+
+        stats = main_loop.context.statistics_manager.get_statistics()
+        assert stats.input_tuple_metrics[0].tuple_metrics.count == len(mock_batch)
+        assert stats.output_tuple_metrics[0].tuple_metrics.count == len(mock_batch)
+
+        reraise()
+
+    @pytest.mark.timeout(5)
+    @pytest.mark.parametrize("slice_size", [1, 0])
+    def test_main_loop_thread_can_process_cooperatively_then_fall_back_to_threads(
+        self,
+        slice_size,
+        monkeypatch,
+        mock_data_output_channel,
+        mock_control_output_channel,
+        input_queue,
+        output_queue,
+        mock_batch,
+        mock_multi_row_data_element,
+        main_loop,
+        main_loop_thread,
+        mock_assign_input_port,
+        mock_assign_output_port,
+        mock_add_input_channel,
+        mock_add_partitioning,
+        mock_initialize_executor,
+        mock_end_of_upstream,
+        command_sequence,
+        reraise,
+    ):
+        monkeypatch.setattr(WorkerConfig, "COOPERATIVE_EXECUTION", True)
+        main_loop.context.tuple_processing_manager.input_slice_size = slice_size
+        main_loop_thread.start()
+
+        for control_element in [
+            mock_assign_input_port,
+            mock_assign_output_port,
+            mock_add_input_channel,
+            mock_add_partitioning,
+            mock_initialize_executor,
+        ]:
+            input_queue.put(control_element)
+            assert output_queue.get() == ControlElement(
+                tag=mock_control_output_channel,
+                payload=ControlPayloadV2(
+                    return_invocation=ReturnInvocation(
+                        command_id=command_sequence,
+                        return_value=ControlReturn(empty_return=EmptyReturn()),
+                    )
+                ),
+            )
+        assert (
+            main_loop.context.executor_manager.execution_mode
+            == ExecutionMode.COOPERATIVE
+        )
+
+        def check_outputs():
+            for expected_tuple in mock_batch:
+                output_data_element: DataElement = output_queue.get()
+                assert output_data_element.tag == mock_data_output_channel
+                data_frame: DataFrame = output_data_element.payload
+                assert Tuple(data_frame.frame.to_pylist()[0]) == expected_tuple
+
+        # the executor runs on the MainLoop thread.
+        input_queue.put(mock_multi_row_data_element)
+        check_outputs()
+        assert main_loop._data_processor_thread is None
+
+        # as a debug command would do, fall back to the threaded execution, which
+        # resumes the processing from where the MainLoop left it.
+        main_loop.context.executor_manager.execution_mode = ExecutionMode.THREADED
+        input_queue.put(mock_multi_row_data_element)
+        check_outputs()
+        assert main_loop._data_processor_thread.is_alive()
+
+        input_queue.put(mock_end_of_upstream)
+        completed_methods = []
+        while "WorkerExecutionCompleted" not in completed_methods:
+            elem = output_queue.get()
+            if isinstance(elem, ControlElement):
+                completed_methods.append(elem.payload.control_invocation.method_name)
+        assert completed_methods[0] == "PortCompleted"
+
+        stats = main_loop.context.statistics_manager.get_statistics()
+        assert stats.input_tuple_metrics[0].tuple_metrics.count == 2 * len(mock_batch)
+        assert stats.output_tuple_metrics[0].tuple_metrics.count == 2 * len(mock_batch)
+
+        reraise()
+
+    @pytest.mark.timeout(5)
+    def test_main_loop_thread_can_process_arrow_batch(
+        self,
+        mock_data_output_channel,
+        mock_control_output_channel,
+        input_queue,
+        output_queue,
+        mock_batch,
+        mock_multi_row_data_element,
+        main_loop,
+        main_loop_thread,
+        mock_assign_input_port,
+        mock_assign_output_port,
+        mock_add_input_channel,
+        mock_add_partitioning,
+        mock_initialize_arrow_batch_executor,
+        mock_end_of_upstream,
+        command_sequence,
+        reraise,
+    ):
+        main_loop_thread.start()
+
+        for control_element in [
+            mock_assign_input_port,
+            mock_assign_output_port,
+            mock_add_input_channel,
+            mock_add_partitioning,
+            mock_initialize_arrow_batch_executor,
+        ]:
+            input_queue.put(control_element)
+            assert output_queue.get() == ControlElement(
+                tag=mock_control_output_channel,
+                payload=ControlPayloadV2(
+                    return_invocation=ReturnInvocation(
+                        command_id=command_sequence,
+                        return_value=ControlReturn(empty_return=EmptyReturn()),
+                    )
+                ),
+            )
+
+        # the whole DataFrame is handed to the executor at once, and the output
+        # batch is sliced by the partitioner, in the schema of the output port.
+        input_queue.put(mock_multi_row_data_element)
+        for expected_tuple in mock_batch:
+            output_data_element: DataElement = output_queue.get()
+            assert output_data_element.tag == mock_data_output_channel
+            data_frame: DataFrame = output_data_element.payload
+            assert data_frame.frame.schema == pyarrow.schema(
+                [("test-1", pyarrow.string()), ("test-2", pyarrow.int32())]
+            )
+            assert len(data_frame.frame) == 1
+            assert Tuple(data_frame.frame.to_pylist()[0]) == expected_tuple
+
+        input_queue.put(mock_end_of_upstream)
+        completed_methods = []
+        while "WorkerExecutionCompleted" not in completed_methods:
+            elem = output_queue.get()
+            if isinstance(elem, ControlElement):
+                completed_methods.append(elem.payload.control_invocation.method_name)
+        assert completed_methods[0] == "PortCompleted"
+
+        stats = main_loop.context.statistics_manager.get_statistics()
+        assert stats.input_tuple_metrics[0].tuple_metrics.count == len(mock_batch)
+        assert stats.output_tuple_metrics[0].tuple_metrics.count == len(mock_batch)
+
+        reraise()
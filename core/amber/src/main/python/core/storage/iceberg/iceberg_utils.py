@@ -27,7 +27,7 @@ from pyiceberg.table import Table
 from typing import Optional, Iterable
 
 import core
-from core.models import ArrowTableTupleProvider, Tuple
+from core.models import ArrowRowView, Tuple
 
 
 def create_postgres_catalog(
@@ -151,11 +151,8 @@ def arrow_table_to_amber_tuples(
     """
     Converts an arrow table to a list of amber tuples for deserialization.
     """
-    tuple_provider = ArrowTableTupleProvider(arrow_table)
+    schema = core.models.Schema(iceberg_schema.as_arrow())
     return (
-        Tuple(
-            {name: field_accessor for name in arrow_table.column_names},
-            schema=core.models.Schema(iceberg_schema.as_arrow()),
-        )
-        for field_accessor in tuple_provider
+        Tuple(row_view, schema=schema)
+        for row_view in ArrowRowView.iter_rows(arrow_table)
     )
@@ -17,11 +17,10 @@
 
 import typing
 
-from pyarrow.lib import Table
-
 from core.architecture.sendsemantics.broad_cast_partitioner import (
     BroadcastPartitioner,
 )
+from core.architecture.sendsemantics.columnar_batch import ColumnarBatch
 from core.architecture.sendsemantics.hash_based_shuffle_partitioner import (
     HashBasedShufflePartitioner,
 )
@@ -79,6 +78,7 @@ class InputPortMaterializationReaderRunnable(Runnable, Stoppable):
         self._stopped = False
         self.materialization = None
         self.tuple_schema = None
+        self.arrow_schema = None
         self._partitioning_to_partitioner: dict[
             type(Partitioning), type(Partitioner)
         ] = {
@@ -119,6 +119,7 @@ class InputPortMaterializationReaderRunnable(Runnable, Stoppable):
             self.materialization, self.tuple_schema = DocumentFactory.open_document(
                 self.uri
             )
+            self.arrow_schema = self.tuple_schema.as_arrow_schema()
             self.emit_marker(StartOfInputChannel())
             storage_iterator = self.materialization.get()
 
@@ -163,18 +164,10 @@ class InputPortMaterializationReaderRunnable(Runnable, Stoppable):
         )
         self.queue.put(queue_element)
 
-    def tuples_to_data_frame(self, tuples: typing.List[Tuple]) -> DataFrame:
+    def tuples_to_data_frame(self, batch: ColumnarBatch) -> DataFrame:
         """
-        Converts a list of tuples to a DataFrame using pyarrow.Table.from_pydict
-        :param tuples:
+        Converts a batch of tuples to a DataFrame, with the cached arrow schema.
+        :param batch:
         :return:
         """
-        return DataFrame(
-            frame=Table.from_pydict(
-                {
-                    name: [t[name] for t in tuples]
-                    for name in self.tuple_schema.get_attr_names()
-                },
-                schema=self.tuple_schema.as_arrow_schema(),
-            )
-        )
+        return DataFrame(frame=batch.to_arrow_table(self.arrow_schema))
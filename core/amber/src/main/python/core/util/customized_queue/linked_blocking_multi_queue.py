@@ -19,7 +19,7 @@ from __future__ import annotations
 
 import sys
 from threading import RLock, Condition
-from typing import List, Optional, Generic, TypeVar, MutableMapping
+from typing import Callable, List, Optional, Generic, TypeVar, MutableMapping
 
 from core.util.customized_queue.inner import inner
 from core.util.customized_queue.queue_base import IKeyedQueue
@@ -32,10 +32,10 @@ T = TypeVar("T")
 class LinkedBlockingMultiQueue(IKeyedQueue):
     @inner
     class Node(Generic[T]):
-        def __init__(self, item: T):
+        def __init__(self, item: T, in_mem_size: int = 0):
             self.item = item
             self.next: Optional[LinkedBlockingMultiQueue.Node[T]] = None
-            self.in_mem_size = sys.getsizeof(item)
+            self.in_mem_size = in_mem_size
 
     @inner
     class SubQueue(Generic[T]):
@@ -62,6 +62,7 @@ class LinkedBlockingMultiQueue(IKeyedQueue):
                     h = p
                     p = h.next
                 self.head = self.last
+                self.in_mem_size.value = 0
                 old_count = self.count.get_and_set(0)
                 if self.enabled:
                     self.owner.total_count.get_and_dec(old_count)
@@ -136,7 +137,7 @@ class LinkedBlockingMultiQueue(IKeyedQueue):
             if obj is None:
                 raise ValueError("Does not support NoneType.")
             old_size = -1
-            node = LinkedBlockingMultiQueue.Node(obj)
+            node = LinkedBlockingMultiQueue.Node(obj, self.owner.sizer(obj))
             self.put_lock.acquire()
             try:
                 self.enqueue(node)
@@ -265,7 +266,12 @@ class LinkedBlockingMultiQueue(IKeyedQueue):
         ) -> None:
             self.priority_groups = priority_groups
 
-    def __init__(self):
+    def __init__(self, sizer: Callable[[T], int] = sys.getsizeof):
+        """
+        :param sizer: gives the in-memory size of an item, which is accounted in
+            the running in-memory size of its SubQueue.
+        """
+        self.sizer: Callable[[T], int] = sizer
         self.take_lock: RLock = RLock()
         self.not_empty: Condition = Condition(self.take_lock)
 
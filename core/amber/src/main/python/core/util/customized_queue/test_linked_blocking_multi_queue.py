@@ -236,3 +236,14 @@ class TestLinkedBlockingMultiQueue:
         assert total == sum(filter(lambda x: x % 3 != 0, range(11)))
 
         reraise()
+
+    def test_in_mem_size_follows_sizer(self):
+        queue = LinkedBlockingMultiQueue(sizer=len)
+        queue.add_sub_queue("data", 1)
+        queue.put("data", "abc")
+        queue.put("data", "de")
+        assert queue.in_mem_size("data") == 5
+        assert queue.get() == "abc"
+        assert queue.in_mem_size("data") == 2
+        queue.get_sub_queue("data").clear()
+        assert queue.in_mem_size("data") == 0
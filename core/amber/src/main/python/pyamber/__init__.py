@@ -24,6 +24,7 @@ from core.models import (
     BatchLike,
     TableOperator,
     BatchOperator,
+    ArrowBatchOperator,
     SourceOperator,
     TupleOperatorV2,
     State,
@@ -38,6 +39,7 @@ __all__ = [
     "BatchLike",
     "TableOperator",
     "BatchOperator",
+    "ArrowBatchOperator",
     "TupleOperatorV2",
     "SourceOperator",
     "State",
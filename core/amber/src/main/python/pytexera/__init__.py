@@ -15,6 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import pyarrow
 from loguru import logger
 from overrides import overrides
 from typing import Iterator, Optional, Union
@@ -25,6 +26,7 @@ from .udf.udf_operator import (
     UDFOperatorV2,
     UDFTableOperator,
     UDFBatchOperator,
+    UDFArrowBatchOperator,
     UDFSourceOperator,
 )
 
@@ -39,11 +41,13 @@ __all__ = [
     "BatchLike",
     "UDFTableOperator",
     "UDFBatchOperator",
+    "UDFArrowBatchOperator",
     "UDFSourceOperator",
     "DatasetFileDocument",
     # export external tools to be used
     "overrides",
     "logger",
+    "pyarrow",
     "Iterator",
     "Optional",
     "Union",
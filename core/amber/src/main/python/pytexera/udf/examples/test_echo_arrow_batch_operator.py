@@ -0,0 +1,40 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import pyarrow
+import pytest
+
+from .echo_arrow_batch_operator import EchoArrowBatchOperator
+
+
+class TestEchoArrowBatchOperator:
+    @pytest.fixture
+    def echo_arrow_batch_operator(self):
+        return EchoArrowBatchOperator()
+
+    def test_echo_arrow_batch_operator(self, echo_arrow_batch_operator):
+        echo_arrow_batch_operator.open()
+        batch = pyarrow.Table.from_pydict(
+            {"test-1": ["hello", "world"], "test-2": [10, 20]}
+        )
+
+        outputs = echo_arrow_batch_operator.process_arrow_batch(batch, 0)
+        output_batch = next(outputs)
+
+        assert output_batch is batch
+        with pytest.raises(StopIteration):
+            next(outputs)
+        echo_arrow_batch_operator.close()
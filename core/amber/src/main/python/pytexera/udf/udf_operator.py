@@ -17,6 +17,9 @@
 
 from abc import abstractmethod
 from typing import Iterator, Optional, Union
+
+import pyarrow
+
 from pyamber import *
 
 
@@ -153,3 +156,48 @@ class UDFBatchOperator(BatchOperator):
         Close the context of the operator.
         """
         pass
+
+
+class UDFArrowBatchOperator(ArrowBatchOperator):
+    """
+    Base class for Arrow-native batch-oriented user-defined operators. A concrete
+    implementation must be provided upon using.
+    """
+
+    def open(self) -> None:
+        """
+        Open a context of the operator. Usually can be used for loading/initiating some
+        resources, such as a file, a model, or an API client.
+        """
+        pass
+
+    @abstractmethod
+    def process_arrow_batch(
+        self, batch: pyarrow.Table, port: int
+    ) -> Iterator[Optional[pyarrow.Table]]:
+        """
+        Process an input batch from the given link. The batch is represented as
+        pyarrow.Table, and is handed over without being converted into Tuples.
+
+        :param batch: pyarrow.Table, a batch to be processed.
+        :param port: int, input index of the current batch.
+        :return: Iterator[Optional[pyarrow.Table]], producing one pyarrow.Table
+            object at a time, or None.
+        """
+        yield
+
+    def on_finish(self, port: int) -> Iterator[Optional[pyarrow.Table]]:
+        """
+        Callback when one input port is exhausted.
+
+        :param port: int, input port index of the current exhausted port.
+        :return: Iterator[Optional[pyarrow.Table]], producing one pyarrow.Table
+            object at a time, or None.
+        """
+        yield
+
+    def close(self) -> None:
+        """
+        Close the context of the operator.
+        """
+        pass
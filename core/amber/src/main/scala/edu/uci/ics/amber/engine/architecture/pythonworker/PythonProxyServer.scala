@@ -36,7 +36,7 @@ import edu.uci.ics.amber.util.ArrowUtils
 import org.apache.arrow.flight._
 import org.apache.arrow.memory.{ArrowBuf, BufferAllocator, RootAllocator}
 import org.apache.arrow.util.AutoCloseables
-import org.apache.arrow.vector.VarBinaryVector
+import org.apache.arrow.vector.{VarBinaryVector, VectorSchemaRoot}
 
 import java.io.IOException
 import java.net.ServerSocket
@@ -62,20 +62,22 @@ private class AmberProducer(
     action.getType match {
       case "control" =>
         val pythonControlMessage = PythonControlMessage.parseFrom(action.getBody)
-        pythonControlMessage.payload.value match {
-          case r: ReturnInvocationV2 =>
-            outputPort.sendTo(
-              to = pythonControlMessage.tag.toWorkerId,
-              payload = r.value
-            )
-
-          case c: ControlInvocationV2 =>
-            outputPort.sendTo(
-              to = pythonControlMessage.tag.toWorkerId,
-              payload = c.value
-            )
-          case payload =>
-            throw new RuntimeException(s"not supported payload $payload")
+        outputPort.synchronized {
+          pythonControlMessage.payload.value match {
+            case r: ReturnInvocationV2 =>
+              outputPort.sendTo(
+                to = pythonControlMessage.tag.toWorkerId,
+                payload = r.value
+              )
+
+            case c: ControlInvocationV2 =>
+              outputPort.sendTo(
+                to = pythonControlMessage.tag.toWorkerId,
+                payload = c.value
+              )
+            case payload =>
+              throw new RuntimeException(s"not supported payload $payload")
+          }
         }
 
         // get little-endian representation of credits
@@ -98,56 +100,85 @@ private class AmberProducer(
 
   }
 
+  /**
+    * Python sends the data batches of a channel through a long-lived stream,
+    * carrying the header of each batch in its app metadata. Each batch is handled
+    * on its own, and acked once handed to the output port, with the credits.
+    * A stream without app metadata is a single message, whose header is the
+    * command of the descriptor.
+    */
   override def acceptPut(
       context: FlightProducer.CallContext,
       flightStream: FlightStream,
       ackStream: FlightProducer.StreamListener[PutResult]
   ): Runnable = { () =>
-    val dataHeader: PythonDataHeader = PythonDataHeader
-      .parseFrom(flightStream.getDescriptor.getCommand)
-    val to: ChannelIdentity = dataHeader.tag
     val root = flightStream.getRoot
+    val bufferAllocator = new RootAllocator(8 * 1024)
+    try {
+      var numStreamedBatches = 0
+      while (flightStream.next) {
+        val metadata = flightStream.getLatestMetadata
+        if (metadata != null) {
+          val header = new Array[Byte](metadata.readableBytes.toInt)
+          metadata.getBytes(metadata.readerIndex, header)
+          handleBatch(PythonDataHeader.parseFrom(header), root)
+          sendCredits(ackStream, bufferAllocator)
+          numStreamedBatches += 1
+        }
+      }
+
+      // closing the stream will release the dictionaries
+      flightStream.takeDictionaryOwnership
 
+      if (numStreamedBatches == 0) {
+        handleBatch(PythonDataHeader.parseFrom(flightStream.getDescriptor.getCommand), root)
+        sendCredits(ackStream, bufferAllocator)
+      }
+    } finally bufferAllocator.close()
+  }
+
+  private def sendCredits(
+      ackStream: FlightProducer.StreamListener[PutResult],
+      bufferAllocator: BufferAllocator
+  ): Unit = {
     // send back ack with credits on ackStream
-    val bufferAllocator = new RootAllocator(8 * 1024)
+    val arrowBuf: ArrowBuf = bufferAllocator.buffer(Longs.BYTES + 4)
     try {
-      val arrowBuf: ArrowBuf = bufferAllocator.buffer(Longs.BYTES + 4)
       arrowBuf.writeLong(
         31L
       ) // TODO : replace with actual credit value
       ackStream.onNext(PutResult.metadata(arrowBuf))
-      arrowBuf.close()
-    } finally if (bufferAllocator != null) bufferAllocator.close()
-
-    // consume all data in the stream, it will store on the root vectors.
-    while (flightStream.next) {}
-
-    // closing the stream will release the dictionaries
-    flightStream.takeDictionaryOwnership
-
-    dataHeader.payloadType match {
-      case "StartOfInputChannel" =>
-        assert(root.getRowCount == 0)
-        outputPort.sendTo(to, MarkerFrame(StartOfInputChannel()))
-      case "EndOfInputChannel" =>
-        assert(root.getRowCount == 0)
-        outputPort.sendTo(to, MarkerFrame(EndOfInputChannel()))
-      case "State" =>
-        assert(root.getRowCount == 1)
-        outputPort.sendTo(to, MarkerFrame(State(Some(ArrowUtils.getTexeraTuple(0, root)))))
-      case "ChannelMarker" =>
-        assert(root.getRowCount == 1)
-        outputPort.sendTo(
-          to,
-          ChannelMarkerPayload.parseFrom(
-            root.getVector("payload").asInstanceOf[VarBinaryVector].get(0)
+    } finally arrowBuf.close()
+  }
+
+  private def handleBatch(dataHeader: PythonDataHeader, root: VectorSchemaRoot): Unit = {
+    val to: ChannelIdentity = dataHeader.tag
+    // the streams of different channels are handled concurrently.
+    outputPort.synchronized {
+      dataHeader.payloadType match {
+        case "StartOfInputChannel" =>
+          assert(root.getRowCount == 0)
+          outputPort.sendTo(to, MarkerFrame(StartOfInputChannel()))
+        case "EndOfInputChannel" =>
+          assert(root.getRowCount == 0)
+          outputPort.sendTo(to, MarkerFrame(EndOfInputChannel()))
+        case "State" =>
+          assert(root.getRowCount == 1)
+          outputPort.sendTo(to, MarkerFrame(State(Some(ArrowUtils.getTexeraTuple(0, root)))))
+        case "ChannelMarker" =>
+          assert(root.getRowCount == 1)
+          outputPort.sendTo(
+            to,
+            ChannelMarkerPayload.parseFrom(
+              root.getVector("payload").asInstanceOf[VarBinaryVector].get(0)
+            )
           )
-        )
-      case _ => // normal data batches
-        val queue = mutable.Queue[Tuple]()
-        for (i <- 0 until root.getRowCount)
-          queue.enqueue(ArrowUtils.getTexeraTuple(i, root))
-        outputPort.sendTo(to, DataFrame(queue.toArray))
+        case _ => // normal data batches
+          val queue = mutable.Queue[Tuple]()
+          for (i <- 0 until root.getRowCount)
+            queue.enqueue(ArrowUtils.getTexeraTuple(i, root))
+          outputPort.sendTo(to, DataFrame(queue.toArray))
+      }
     }
   }
 }